@@ -0,0 +1,64 @@
+"""룰렛 성능 측정 스크립트
+
+참가자 수별로 휠 생성, 프레임 그리기, 세그먼트 조회 시간을 측정합니다.
+
+    python benchmarks/bench_roulette.py
+"""
+
+import os
+import sys
+import time
+
+# 화면 없이 실행
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from game.roulette import Roulette
+
+PLAYER_COUNTS = [10, 100, 1000, 10000]
+DRAW_FRAMES = 120
+LOOKUPS = 100000
+
+
+def bench(screen, font, player_count):
+    players = [f"플레이어{i}" for i in range(player_count)]
+    roulette = Roulette(screen, players, font)
+
+    start = time.perf_counter()
+    roulette.draw()  # 첫 프레임에서 휠 캐시 생성
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for frame in range(DRAW_FRAMES):
+        roulette.angle = frame * 3.7
+        roulette.draw()
+    draw_ms = (time.perf_counter() - start) * 1000 / DRAW_FRAMES
+
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        roulette.player_at_angle(i * 0.37)
+    lookup_us = (time.perf_counter() - start) * 1e6 / LOOKUPS
+
+    return build_ms, draw_ms, lookup_us
+
+
+def main():
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((800, 600))
+    font = pygame.font.Font(None, 24)
+
+    print(f"{'players':>8} {'build(ms)':>10} {'draw(ms)':>10} {'lookup(us)':>11}")
+    for player_count in PLAYER_COUNTS:
+        build_ms, draw_ms, lookup_us = bench(screen, font, player_count)
+        print(
+            f"{player_count:>8} {build_ms:>10.2f} {draw_ms:>10.3f} {lookup_us:>11.3f}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
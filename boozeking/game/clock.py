@@ -0,0 +1,45 @@
+import time
+
+
+class GameClock:
+    """룰렛과 타이머가 함께 사용하는 단조 증가 게임 시계 (델타 타임 계산용)"""
+
+    def __init__(self, fixed_step=None, max_delta=1.0, time_source=time.perf_counter):
+        self.fixed_step = fixed_step  # 고정 시간 간격 (초, None이면 가변 델타 타임)
+        self.max_delta = max_delta  # 한 프레임에 진행할 수 있는 최대 시간
+        self._time_source = time_source
+        self._last = time_source()
+        self._accumulator = 0.0
+        self.time = 0.0  # 게임 시작 후 흐른 시간 (초)
+        self.delta = 0.0  # 마지막 프레임의 델타 타임 (초)
+
+    def now(self):
+        """현재 게임 시간 (초)"""
+        return self.time
+
+    def tick(self):
+        """실제 경과 시간만큼 시계를 진행하고 델타 타임 반환"""
+        current = self._time_source()
+        elapsed = current - self._last
+        self._last = current
+        return self.advance(elapsed)
+
+    def advance(self, dt):
+        """게임 시간을 dt초만큼 진행 (리플레이 등에서 직접 호출 가능)"""
+        dt = min(max(0.0, dt), self.max_delta)
+        self.time += dt
+        self.delta = dt
+        self._accumulator += dt
+        return dt
+
+    def resume(self):
+        """대기하던 시간은 게임 시간에 포함하지 않고 기준 시각만 갱신"""
+        self._last = self._time_source()
+
+    def steps(self):
+        """고정 시간 간격 모드에서 이번 프레임에 진행할 스텝 수"""
+        if not self.fixed_step:
+            return 0
+        count = int(self._accumulator // self.fixed_step)
+        self._accumulator -= count * self.fixed_step
+        return count
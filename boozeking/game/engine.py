@@ -0,0 +1,241 @@
+import random
+
+from game.clock import GameClock
+from game.manager import GameManager
+from game.question import QuestionManager
+from game.roulette_model import RouletteModel
+from game.timers import TimerService
+
+
+# 게임 상태 정의
+class GameState:
+    MENU = 0
+    PLAYER_REGISTRATION = 1
+    QUESTION_SELECTION = 2
+    ROULETTE = 3
+    ANSWER = 4
+    RESULT = 5
+
+
+# 상태별로 허용되는 동작과 처리 메서드 (표에 없는 동작은 무시)
+TRANSITIONS = {
+    GameState.MENU: {
+        "start": "_start_game",
+        "register": "_open_registration",
+    },
+    GameState.PLAYER_REGISTRATION: {
+        "add_player": "_add_player",
+        "remove_player": "_remove_player",
+        "start": "_start_game",
+        "back": "_back_to_menu",
+    },
+    GameState.QUESTION_SELECTION: {
+        "spin": "_start_spin",
+        "back": "_back_to_menu",
+    },
+    GameState.ROULETTE: {
+        "skip": "_skip_spin",
+        "confirm": "_confirm_player",
+        "back": "_back_to_menu",
+    },
+    GameState.ANSWER: {
+        "answer": "_answer",
+        "time_up": "_time_up",
+        "back": "_back_to_menu",
+    },
+    GameState.RESULT: {
+        "next_round": "_next_round",
+        "back": "_back_to_menu",
+    },
+}
+
+
+class GameEngine:
+    """pygame 없이 동작하는 게임 진행 로직
+
+    화면과 입력 장치는 모르고 dispatch()로 받은 동작에 따라 상태를 바꿉니다.
+    pygame 화면(main.py)은 클릭/키 입력을 동작으로 바꿔 전달하기만 합니다.
+    """
+
+    def __init__(
+        self,
+        game_manager,
+        question_manager,
+        roulette,
+        clock=None,
+        skip_spin_animation=False,
+        poll_timers=True,
+    ):
+        self.game_manager = game_manager
+        self.question_manager = question_manager
+        self.roulette = roulette  # RouletteModel (또는 화면에 그리는 Roulette)
+        self.clock = clock or GameClock()
+
+        # 답변 시간 초과 등 게임 시계 기준 예약 작업
+        # poll_timers가 True이면 update()마다 만료된 타이머를 실행하고, False이면
+        # 호출하는 쪽(pygame 화면)이 알림에 맞춰 timers.run_due()를 호출함
+        self.timers = TimerService(self.clock.now)
+        self.poll_timers = poll_timers
+        self._answer_timer = None
+
+        # True이면 룰렛 애니메이션 없이 바로 결과 표시
+        self.skip_spin_animation = skip_spin_animation
+
+        self.state = GameState.MENU
+        self.current_question = None
+        self.current_player = None
+        # 라운드 결과 (답변/시간 초과로 넘어가는 순간 확정, 결과 화면은 이 값만 사용)
+        self.answered = None
+        self.response_time = None
+        self._listeners = []
+
+        # 플레이어 목록이 바뀌면 룰렛이 바뀐 부분만 직접 갱신
+        self.roulette.bind(self.game_manager.players)
+
+    def subscribe(self, callback):
+        """상태 변경 알림 등록 (callback(이전 상태, 새 상태))"""
+        self._listeners.append(callback)
+
+    def _set_state(self, state):
+        if state != self.state:
+            previous = self.state
+            self.state = state
+            for callback in list(self._listeners):
+                callback(previous, state)
+
+    def can(self, action):
+        """현재 상태에서 action을 처리할 수 있는지 확인"""
+        return action in TRANSITIONS[self.state]
+
+    def dispatch(self, action, *args):
+        """동작 처리 (현재 상태에서 허용되지 않는 동작이면 False 반환)"""
+        handler = TRANSITIONS[self.state].get(action)
+        if handler is None:
+            return False
+        result = getattr(self, handler)(*args)
+        return True if result is None else result
+
+    def _start_game(self):
+        # 플레이어가 2명 이상일 때만 게임 시작
+        if len(self.game_manager.players) > 1:
+            return self._next_round()
+        elif self.state == GameState.MENU:
+            self._set_state(GameState.PLAYER_REGISTRATION)
+        else:
+            return False
+
+    def _open_registration(self):
+        self._set_state(GameState.PLAYER_REGISTRATION)
+
+    def _back_to_menu(self):
+        self._cancel_answer_timer()
+        self._set_state(GameState.MENU)
+
+    def _add_player(self, name):
+        return self.game_manager.add_player(name)
+
+    def _remove_player(self, name):
+        return self.game_manager.remove_player(name)
+
+    def _start_spin(self, fast=None):
+        if fast is None:
+            fast = self.skip_spin_animation
+        self._set_state(GameState.ROULETTE)
+        self.roulette.start_spin(fast=fast)
+
+    def _skip_spin(self):
+        if not self.roulette.spinning:
+            return False
+        self.roulette.skip_spin()
+
+    def _confirm_player(self):
+        # 룰렛이 멈추고 플레이어가 선택된 뒤에만 답변 단계로 이동
+        if self.roulette.spinning or not self.roulette.selected_player:
+            return False
+        self.current_player = self.roulette.selected_player
+        self.game_manager.set_current_player(self.current_player)
+        self.game_manager.set_current_question(self.current_question)
+        self.game_manager.start_timer()
+        # 제한 시간이 지나면 한 번만 시간 초과 처리
+        self._answer_timer = self.timers.schedule(
+            self.game_manager.timer_duration, self.dispatch, "time_up"
+        )
+        self._set_state(GameState.ANSWER)
+
+    def _cancel_answer_timer(self):
+        self.timers.cancel(self._answer_timer)
+        self._answer_timer = None
+
+    def _answer(self):
+        # 만료 알림이 처리되기 전에 들어온 답변은 시간 초과로 처리
+        self._finish_round(answered=not self.game_manager.is_time_up())
+
+    def _time_up(self):
+        self._finish_round(answered=False)
+
+    def _finish_round(self, answered):
+        self._cancel_answer_timer()
+        self.answered = answered
+        self.response_time = self.game_manager.record_round(answered)
+        self._set_state(GameState.RESULT)
+
+    def _next_round(self):
+        question = self.question_manager.get_random_question()
+        if question is None:
+            # 뽑을 질문이 없으면 질문 없이 라운드를 시작하지 않음
+            print("선택할 수 있는 질문이 없습니다")
+            return False
+        self.current_question = question
+        self._set_state(GameState.QUESTION_SELECTION)
+
+    def update(self, dt):
+        """게임 시간 dt초만큼 진행 (룰렛 회전, 답변 타이머)"""
+        # 고정 시간 간격 모드에서 이번 프레임에 진행할 스텝 수
+        steps = self.clock.steps()
+
+        if self.state == GameState.ROULETTE:
+            if self.roulette.spinning:
+                if self.clock.fixed_step:
+                    # 쌓인 시간만큼 미리 계산한 궤적을 스텝 단위로 재생
+                    for _ in range(steps):
+                        self.roulette.update()
+                else:
+                    self.roulette.update(dt)
+
+        # 만료된 타이머 실행 (답변 시간 초과 등)
+        if self.poll_timers:
+            self.timers.run_due()
+
+    def play_round(self, answered=True):
+        """질문 선택부터 결과까지 한 라운드를 바로 진행하고 지목된 플레이어 반환
+
+        애니메이션과 타이머를 기다리지 않으므로 헤드리스 시뮬레이션에 사용합니다.
+        """
+        if self.state == GameState.RESULT:
+            self.dispatch("next_round")
+        elif self.state != GameState.QUESTION_SELECTION:
+            self._set_state(GameState.MENU)
+            self.dispatch("start")
+        if self.state != GameState.QUESTION_SELECTION:
+            return None
+
+        self.dispatch("spin", True)
+        self.dispatch("confirm")
+        self.dispatch("answer" if answered else "time_up")
+        return self.current_player
+
+
+def create_headless_engine(
+    players=(), weights=None, data_path=None, questions_path=None, rng=random
+):
+    """화면 없이 게임 로직만 실행하는 엔진 생성 (data_path가 없으면 저장하지 않음)"""
+    clock = GameClock()
+    game_manager = GameManager(data_path, time_source=clock.now)
+    game_manager.add_players(players, weights)
+
+    question_manager = QuestionManager(rng)
+    if questions_path:
+        question_manager.load_bank(questions_path)
+
+    roulette = RouletteModel(game_manager.players, game_manager.get_weights(), rng)
+    return GameEngine(game_manager, question_manager, roulette, clock)
@@ -0,0 +1,153 @@
+import json
+import os
+import sys
+
+import pygame
+
+from game.storage import atomic_write_json
+
+# 게임에 포함된 폰트 (있으면 시스템 폰트를 찾지 않음)
+BUNDLED_FONT = os.path.join(os.path.dirname(__file__), "fonts", "NanumGothic.ttf")
+
+# 번들 폰트가 없을 때 순서대로 찾아볼 시스템 폰트 (한글 지원 폰트 우선)
+FALLBACK_FONTS = [
+    "AppleGothic",
+    "AppleSDGothicNeo-Regular",
+    "NanumGothic",
+    "NanumBarunGothic",
+    "Arial Unicode MS",
+    "Arial",
+]
+
+# 찾은 폰트 경로를 저장해 두는 파일 (다음 실행부터 시스템 폰트 목록을 읽지 않음)
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "boozeking",
+    "font_path.json",
+)
+
+CACHE_VERSION = 1
+
+
+def system_font_dirs():
+    """운영체제별 시스템 폰트 디렉토리 목록"""
+    home = os.path.expanduser("~")
+    if sys.platform == "darwin":
+        return [
+            "/System/Library/Fonts",
+            "/Library/Fonts",
+            os.path.join(home, "Library", "Fonts"),
+        ]
+    if sys.platform == "win32":
+        windir = os.environ.get("WINDIR", "C:\\Windows")
+        return [
+            os.path.join(windir, "Fonts"),
+            os.path.join(
+                os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts"
+            ),
+        ]
+    return [
+        "/usr/share/fonts",
+        "/usr/local/share/fonts",
+        os.path.join(home, ".fonts"),
+        os.path.join(home, ".local", "share", "fonts"),
+    ]
+
+
+def font_dirs_signature():
+    """폰트 디렉토리(와 바로 아래 하위 디렉토리)의 수정 시각 목록
+
+    폰트를 설치하거나 지우면 해당 디렉토리의 수정 시각이 바뀌므로 캐시 무효화에 사용
+    """
+    signature = []
+    for directory in system_font_dirs():
+        try:
+            signature.append([directory, os.stat(directory).st_mtime_ns])
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        signature.append([entry.path, entry.stat().st_mtime_ns])
+        except OSError:
+            continue
+    signature.sort()
+    return signature
+
+
+def find_system_font():
+    """FALLBACK_FONTS 중 설치된 첫 번째 폰트의 경로 (없으면 None)"""
+    for name in FALLBACK_FONTS:
+        for directory in ("/Library/Fonts", "/System/Library/Fonts"):
+            path = os.path.join(directory, f"{name}.ttf")
+            if os.path.exists(path):
+                return path
+    # 시스템 폰트 전체 목록은 여기서 한 번만 읽음
+    for name in FALLBACK_FONTS:
+        path = pygame.font.match_font(name)
+        if path:
+            return path
+    return None
+
+
+def resolve_font_path(cache_path=CACHE_PATH):
+    """사용할 폰트 파일 경로 (None이면 pygame 기본 폰트)
+
+    번들 폰트가 없으면 시스템 폰트를 찾아 결과를 cache_path에 저장해 두고, 폰트
+    디렉토리가 바뀌지 않았다면 다음 실행부터는 저장된 결과를 바로 사용합니다.
+    """
+    if os.path.exists(BUNDLED_FONT):
+        return BUNDLED_FONT
+
+    signature = font_dirs_signature()
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if (
+            cached.get("version") == CACHE_VERSION
+            and cached.get("signature") == signature
+            and (cached["path"] is None or os.path.exists(cached["path"]))
+        ):
+            return cached["path"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    path = find_system_font()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        atomic_write_json(
+            cache_path,
+            {"version": CACHE_VERSION, "signature": signature, "path": path},
+        )
+    except OSError as e:
+        print(f"폰트 캐시 저장 실패: {e}")
+    return path
+
+
+class FontLibrary:
+    """크기별 폰트를 처음 사용할 때 한 번만 로드해 공유하는 폰트 모음"""
+
+    def __init__(self, path=None, cache_path=CACHE_PATH):
+        self._path = path
+        self._resolved = path is not None
+        self.cache_path = cache_path
+        self._fonts = {}
+
+    @property
+    def path(self):
+        """사용하는 폰트 파일 경로 (처음 접근할 때 결정)"""
+        if not self._resolved:
+            self._path = resolve_font_path(self.cache_path)
+            self._resolved = True
+        return self._path
+
+    def get(self, size):
+        """size 크기의 폰트 (같은 크기는 같은 Font 객체를 반환)"""
+        font = self._fonts.get(size)
+        if font is None:
+            try:
+                font = pygame.font.Font(self.path, size)
+            except (pygame.error, OSError) as e:
+                print(f"폰트 로드 오류: {e}")
+                # 폰트 파일을 열 수 없으면 Pygame 기본 폰트 사용 (한글 지원 안될 수 있음)
+                font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
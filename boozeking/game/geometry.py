@@ -0,0 +1,82 @@
+import math
+from array import array
+from functools import lru_cache
+
+# 호 해상도 (한 바퀴를 몇 개의 점으로 나눌지), 저사양 기기에서는 낮은 품질 사용
+ARC_QUALITY = {
+    "high": 360,  # 1도 간격
+    "medium": 180,  # 2도 간격
+    "low": 90,  # 4도 간격
+}
+
+
+@lru_cache(maxsize=None)
+def unit_circle(resolution):
+    """단위원 위의 cos/sin 값 테이블 (resolution개의 점, 0도부터 시계 방향)"""
+    step = 2 * math.pi / resolution
+    cos_table = array("f", (math.cos(i * step) for i in range(resolution)))
+    sin_table = array("f", (math.sin(i * step) for i in range(resolution)))
+    return cos_table, sin_table
+
+
+class WheelGeometry:
+    """반지름별로 미리 계산한 원 둘레 좌표 테이블과 부채꼴 다각형 생성"""
+
+    def __init__(self, radius, resolution=ARC_QUALITY["high"]):
+        self.radius = radius
+        self.resolution = resolution
+        self.step_degrees = 360 / resolution
+
+        cos_table, sin_table = unit_circle(resolution)
+        # 반지름을 곱해 정수 좌표로 변환 (중심 기준 상대 좌표)
+        self.xs = array("i", (int(radius * c) for c in cos_table))
+        self.ys = array("i", (int(radius * s) for s in sin_table))
+
+    def point_at(self, angle_deg, scale=1.0):
+        """임의 각도의 원 둘레 좌표 (중심 기준 상대 좌표)"""
+        rad = math.radians(angle_deg)
+        r = self.radius * scale
+        return int(r * math.cos(rad)), int(r * math.sin(rad))
+
+    def arc_points(self, start_deg, end_deg):
+        """start_deg ~ end_deg 사이의 테이블 좌표 (중심 기준 상대 좌표)"""
+        first = math.ceil(start_deg / self.step_degrees)
+        last = math.floor(end_deg / self.step_degrees)
+        if last < first:
+            return []
+
+        # 테이블 범위를 넘어가면 한 바퀴 돌아서 이어 붙임
+        xs = []
+        ys = []
+        index = first
+        while index <= last:
+            offset = index % self.resolution
+            count = min(last - index + 1, self.resolution - offset)
+            xs.extend(self.xs[offset : offset + count])
+            ys.extend(self.ys[offset : offset + count])
+            index += count
+        return list(zip(xs, ys))
+
+    def sector_polygon(self, center, start_deg, end_deg):
+        """부채꼴 다각형의 점 목록 (중심 → 호 → 중심)"""
+        cx, cy = center
+        arc = self.arc_points(start_deg, end_deg)
+
+        # 테이블 간격에 맞지 않는 양 끝 각도는 정확한 좌표로 보완
+        start_point = self.point_at(start_deg)
+        end_point = self.point_at(end_deg)
+        if not arc or arc[0] != start_point:
+            arc.insert(0, start_point)
+        if arc[-1] != end_point:
+            arc.append(end_point)
+
+        points = [center]
+        points.extend((cx + x, cy + y) for x, y in arc)
+        points.append(center)
+        return points
+
+
+@lru_cache(maxsize=16)
+def wheel_geometry(radius, resolution=ARC_QUALITY["high"]):
+    """반지름과 해상도별 WheelGeometry (한 번만 생성해서 공유)"""
+    return WheelGeometry(radius, resolution)
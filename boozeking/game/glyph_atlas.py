@@ -0,0 +1,292 @@
+import pygame
+
+GLYPH_PADDING = 1  # 글리프 사이 여백 (보간 시 옆 글리프가 번지지 않도록)
+MAX_KERNING_PAIRS = 65536  # 이보다 많아지면 커닝 캐시를 비움
+WHITE = (255, 255, 255)
+MAX_TINTS = (
+    4  # 글리프마다 색을 입혀 둘 색상 수 (가장 많이 쓰는 색만, 나머지는 그릴 때 입힘)
+)
+MIN_PAGE_SIZE = 64  # 새 페이지의 최소 크기 (가득 차면 최대 크기까지 두 배씩 키움)
+
+
+def tint(surface, color):
+    """흰색 글리프 Surface에 color 색을 입힌 복사본 (투명도는 유지)"""
+    tinted = surface.copy()
+    tinted.fill(tuple(color)[:3] + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+    return tinted
+
+
+class AtlasPage:
+    """글리프를 선반(shelf) 방식으로 채워 넣는 아틀라스 페이지 하나
+
+    작은 크기로 시작해 자리가 모자라면 max_size까지 가로, 세로를 번갈아 두 배로
+    키우므로, 글자를 몇 개만 쓰는 폰트도 큰 페이지를 통째로 잡지 않습니다.
+    """
+
+    def __init__(self, size, max_size):
+        self.width = self.height = min(size, max_size)
+        self.max_size = max_size
+        self.surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.shelves = []  # [y, 높이, 다음 글리프의 x]
+        self.next_y = 0
+        self.glyphs = []  # 이 페이지에 들어 있는 글자 (페이지를 비울 때 사용)
+        self.last_used = 0
+
+    def allocate(self, width, height):
+        """width x height 영역을 할당하고 위치 반환 (최대 크기로도 자리가 없으면 None)"""
+        width += GLYPH_PADDING
+        height += GLYPH_PADDING
+        if width > self.max_size or height > self.max_size:
+            return None
+
+        while True:
+            position = self._allocate(width, height)
+            if position is not None or not self._grow():
+                return position
+
+    def _allocate(self, width, height):
+        # 높이가 맞는 선반에 남은 자리가 있으면 사용
+        for shelf in self.shelves:
+            y, shelf_height, x = shelf
+            if height <= shelf_height and x + width <= self.width:
+                shelf[2] += width
+                return x, y
+
+        # 없으면 아래에 새 선반 추가
+        if width > self.width or self.next_y + height > self.height:
+            return None
+        y = self.next_y
+        self.shelves.append([y, height, width])
+        self.next_y += height
+        return 0, y
+
+    def _grow(self):
+        """페이지를 두 배로 키움 (이미 최대 크기면 False)"""
+        if self.width <= self.height and self.width < self.max_size:
+            self.width *= 2
+        elif self.height < self.max_size:
+            self.height *= 2
+        else:
+            return False
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        surface.blit(self.surface, (0, 0))
+        self.surface = surface
+        return True
+
+    def reset(self):
+        """페이지를 비워 다시 사용할 수 있게 함 (키운 크기는 유지)"""
+        self.surface.fill((0, 0, 0, 0))
+        self.shelves = []
+        self.next_y = 0
+        self.glyphs = []
+
+    def add_glyph(self, surface, rect):
+        """흰색 글리프를 rect 위치에 추가"""
+        self.surface.blit(surface, rect)
+
+
+class GlyphAtlas:
+    """폰트 하나의 글리프를 한 번만 래스터화해 아틀라스에 모아 두고 조합해서 그림
+
+    글리프는 흰색으로 저장해 두고, 문자열을 그릴 때 글리프 영역을 차례로 블릿한 뒤
+    색을 곱해 입힙니다. 가장 많이 쓰는 MAX_TINTS개 색은 글리프별로 색을 입힌
+    복사본을 캐시해 두어 곱셈을 생략합니다. 페이지가 최대 크기까지 차면 새 페이지를
+    만들고, 최대 페이지 수에 이르면 가장 오래 사용하지 않은 페이지를 비워 재사용합니다.
+    """
+
+    def __init__(self, font, page_size=None, max_pages=4):
+        self.font = font
+        self.height = font.get_height()
+        if page_size is None:
+            # 한 페이지에 글리프가 256개 정도 들어가는 2의 거듭제곱 크기
+            page_size = 256
+            while page_size < 16 * (self.height + GLYPH_PADDING * 2):
+                page_size *= 2
+        self.page_size = page_size  # 페이지 최대 크기
+        # 새 페이지는 글리프가 16개 정도 들어가는 크기로 시작
+        self.initial_page_size = MIN_PAGE_SIZE
+        while self.initial_page_size < 4 * (self.height + GLYPH_PADDING * 2):
+            self.initial_page_size *= 2
+        self.max_pages = max_pages
+        self.pages = []
+        self._glyphs = {}  # 글자 -> (페이지, 아틀라스 안의 Rect)
+        self._tints = {}  # 색상 -> {글자: 색을 입힌 글리프} (가장 많이 쓰는 색만)
+        self._color_uses = {}  # 색상 -> 그린 문자열 수 (색을 입혀 둘 색 선택용)
+        self._metrics = {}  # 글자 -> (글자 폭, 높이) (px)
+        self._kerning = {}  # (앞 글자, 뒤 글자) -> 간격 보정 (px)
+        self._clock = 0  # 페이지 사용 순서 기록용
+        self.rasterized = 0
+        self.evictions = 0
+
+    def metrics(self, char):
+        """글자 하나의 (폭, 높이) (px, 아래로 긴 글자는 폰트 높이보다 클 수 있음)"""
+        metrics = self._metrics.get(char)
+        if metrics is None:
+            metrics = self.font.size(char)
+            self._metrics[char] = metrics
+        return metrics
+
+    def advance(self, char):
+        """글자 하나의 폭 (px)"""
+        return self.metrics(char)[0]
+
+    def kerning(self, left, right):
+        """두 글자를 이어 쓸 때의 간격 보정 (px)"""
+        pair = (left, right)
+        offset = self._kerning.get(pair)
+        if offset is None:
+            if len(self._kerning) >= MAX_KERNING_PAIRS:
+                self._kerning.clear()
+            offset = (
+                self.font.size(left + right)[0]
+                - self.advance(left)
+                - self.advance(right)
+            )
+            self._kerning[pair] = offset
+        return offset
+
+    def _new_page(self):
+        """새 페이지를 만들거나, 더 만들 수 없으면 가장 오래 쓰지 않은 페이지를 비움"""
+        if len(self.pages) < self.max_pages:
+            page = AtlasPage(self.initial_page_size, self.page_size)
+            self.pages.append(page)
+            return page
+
+        page = min(self.pages, key=lambda p: p.last_used)
+        for char in page.glyphs:
+            del self._glyphs[char]
+            for tinted in self._tints.values():
+                tinted.pop(char, None)
+        page.reset()
+        self.evictions += 1
+        return page
+
+    def _rasterize(self, char):
+        """글자 하나를 흰색으로 래스터화해 아틀라스에 추가"""
+        surface = self.font.render(char, True, WHITE)
+        width, height = surface.get_size()
+
+        position = None
+        for page in reversed(self.pages):
+            position = page.allocate(width, height)
+            if position is not None:
+                break
+        if position is None:
+            page = self._new_page()
+            position = page.allocate(width, height)
+            if position is None:
+                # 페이지보다 큰 글리프는 아틀라스에 넣지 않음
+                return None
+
+        rect = pygame.Rect(position, (width, height))
+        page.add_glyph(surface, rect)
+        page.glyphs.append(char)
+        self._glyphs[char] = (page, rect)
+        self.rasterized += 1
+        return page, rect
+
+    def glyph(self, char):
+        """글자의 (페이지, Rect) (처음 사용할 때 래스터화)"""
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self._rasterize(char)
+        return glyph
+
+    def _tint_cache(self, color):
+        """color 색의 글리프 캐시 (자주 쓰는 색이 아니면 None)
+
+        사용 횟수가 가장 많은 MAX_TINTS개 색만 캐시하며, 어떤 색이 캐시된 색 중
+        가장 적게 쓴 색보다 많이 쓰이면 그 색의 캐시를 버리고 대신 캐시합니다.
+        """
+        uses = self._color_uses.get(color, 0) + 1
+        self._color_uses[color] = uses
+        tinted = self._tints.get(color)
+        if tinted is not None:
+            return tinted
+
+        if len(self._tints) >= MAX_TINTS:
+            least = min(self._tints, key=self._color_uses.__getitem__)
+            if self._color_uses[least] >= uses:
+                return None
+            del self._tints[least]
+        tinted = {}
+        self._tints[color] = tinted
+        return tinted
+
+    def size(self, text):
+        """문자열의 (폭, 높이) (font.size와 같은 값)"""
+        width = 0
+        height = self.height
+        previous = None
+        for char in text:
+            if previous is not None:
+                width += self.kerning(previous, char)
+            advance, char_height = self.metrics(char)
+            width += advance
+            height = max(height, char_height)
+            previous = char
+        return max(0, width), height
+
+    def render(self, text, color):
+        """문자열을 color 색으로 그린 Surface 반환 (font.render(text, True, color) 대체)"""
+        color = tuple(color)[:3]
+        width, height = self.size(text)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        self._clock += 1
+        tinted = self._tint_cache(color)
+        blits = []
+        x = 0
+        previous = None
+        for char in text:
+            if previous is not None:
+                x += self.kerning(previous, char)
+            previous = char
+            advance = self.advance(char)
+            if advance and not char.isspace():
+                glyph = self._glyphs.get(char)
+                if glyph is None:
+                    # 새 글리프를 넣다가 페이지가 비워질 수 있으므로 모아 둔 글리프를 먼저 그림
+                    self._blit_all(surface, blits)
+                    blits = []
+                    glyph = self._rasterize(char)
+
+                if glyph is None:
+                    # 아틀라스에 넣지 못한 큰 글리프 (색은 다른 글리프와 같은 방식으로 입힘)
+                    source, area = self.font.render(char, True, WHITE), None
+                    if tinted is not None:
+                        source = tint(source, color)
+                else:
+                    page, area = glyph
+                    page.last_used = self._clock
+                    if tinted is None:
+                        source = page.surface
+                    else:
+                        source = tinted.get(char)
+                        if source is None:
+                            source = tint(page.surface.subsurface(area), color)
+                            tinted[char] = source
+                        area = None
+                blits.append((source, (x, 0), area))
+            x += advance
+        self._blit_all(surface, blits)
+
+        if tinted is None:
+            # 자주 쓰지 않는 색은 흰색으로 조합한 뒤 한 번에 색을 입힘
+            surface = tint(surface, color)
+        return surface
+
+    def _blit_all(self, surface, blits):
+        # 투명한 Surface 위에 알파 블렌딩하면 가장자리가 어두워지므로 최대값으로 합성
+        # (겹치는 글리프도 자연스럽게 합쳐짐)
+        for source, position, area in blits:
+            surface.blit(source, position, area, special_flags=pygame.BLEND_RGBA_MAX)
+
+    def clear(self):
+        """아틀라스와 글자 폭/커닝 캐시 비우기"""
+        self.pages = []
+        self._glyphs.clear()
+        self._tints.clear()
+        self._color_uses.clear()
+        self._metrics.clear()
+        self._kerning.clear()
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+
+import pygame
+
+SCROLLBAR_WIDTH = 4
+SCROLLBAR_MIN_HEIGHT = 12
+SCROLLBAR_COLOR = (150, 150, 150)
+
+
+class ListView:
+    """스크롤 위치에서 보이는 행만 그리는 목록 (목록 길이와 관계없이 그리는 비용 일정)
+
+    행 Surface는 render_row(항목)로 한 번만 만들어 캐시해 두고, 화면에는 rect 안에
+    보이는 범위의 행만 블릿합니다. items는 len()과 인덱스 접근을 지원하면 됩니다.
+    """
+
+    def __init__(self, rect, render_row, row_height=30, max_cached_rows=128):
+        self.rect = pygame.Rect(rect)
+        self.render_row = render_row
+        self.row_height = row_height
+        self.max_cached_rows = max_cached_rows
+        self.scroll = 0  # 목록 맨 위에서 내려간 거리 (px)
+        self._rows = OrderedDict()  # 항목 -> 행 Surface (LRU)
+
+    def page_rows(self):
+        """한 화면에 보이는 행 수"""
+        return max(1, self.rect.height // self.row_height)
+
+    def max_scroll(self, count):
+        """항목이 count개일 때 내려갈 수 있는 최대 거리 (px)"""
+        return max(0, count * self.row_height - self.rect.height)
+
+    def scroll_by(self, dy, count):
+        """dy px만큼 스크롤 (실제로 움직였으면 True)"""
+        scroll = min(max(0, self.scroll + dy), self.max_scroll(count))
+        if scroll == self.scroll:
+            return False
+        self.scroll = scroll
+        return True
+
+    def ensure_visible(self, index, count):
+        """index 번째 행이 보이도록 스크롤 (움직였으면 True)"""
+        top = index * self.row_height
+        if top < self.scroll:
+            return self.scroll_by(top - self.scroll, count)
+        bottom = top + self.row_height - self.rect.height
+        if bottom > self.scroll:
+            return self.scroll_by(bottom - self.scroll, count)
+        return False
+
+    def visible_range(self, count):
+        """보이는 행의 인덱스 범위 (first, last) (last는 포함하지 않음)"""
+        first = self.scroll // self.row_height
+        last = -(-(self.scroll + self.rect.height) // self.row_height)
+        return min(first, count), min(last, count)
+
+    def row_rect(self, index):
+        """index 번째 행의 화면 영역 (목록 영역 밖일 수 있음)"""
+        y = self.rect.top + index * self.row_height - self.scroll
+        return pygame.Rect(self.rect.left, y, self.rect.width, self.row_height)
+
+    def row_surface(self, item):
+        """항목의 행 Surface (처음 그릴 때만 render_row 호출)"""
+        surface = self._rows.get(item)
+        if surface is None:
+            surface = self.render_row(item)
+            self._rows[item] = surface
+            if len(self._rows) > self.max_cached_rows:
+                self._rows.popitem(last=False)
+        else:
+            self._rows.move_to_end(item)
+        return surface
+
+    def invalidate(self):
+        """행 Surface 캐시 비우기 (폰트나 행 모양이 바뀐 경우)"""
+        self._rows.clear()
+
+    def draw(self, screen, items):
+        """보이는 행을 그리고 [(인덱스, 항목, 행 Rect)] 목록 반환"""
+        count = len(items)
+        # 항목이 줄어들어 스크롤 위치가 범위를 벗어난 경우 맞춰 줌
+        self.scroll = min(self.scroll, self.max_scroll(count))
+
+        # 걸쳐 있는 행이 목록 영역 밖으로 그려지지 않도록 자름 (기존 클리핑 영역 유지)
+        previous_clip = screen.get_clip()
+        screen.set_clip(previous_clip.clip(self.rect))
+
+        visible = []
+        first, last = self.visible_range(count)
+        for index in range(first, last):
+            item = items[index]
+            rect = self.row_rect(index)
+            screen.blit(self.row_surface(item), rect)
+            visible.append((index, item, rect))
+
+        if self.max_scroll(count):
+            self._draw_scrollbar(screen, count)
+        screen.set_clip(previous_clip)
+        return visible
+
+    def _draw_scrollbar(self, screen, count):
+        # 전체 목록 중 보이는 부분의 위치와 비율을 나타내는 막대
+        view_height = self.rect.height
+        content_height = count * self.row_height
+        height = max(SCROLLBAR_MIN_HEIGHT, view_height * view_height // content_height)
+        travel = view_height - height
+        y = self.rect.top + travel * self.scroll // self.max_scroll(count)
+        bar_rect = pygame.Rect(
+            self.rect.right - SCROLLBAR_WIDTH, y, SCROLLBAR_WIDTH, height
+        )
+        pygame.draw.rect(screen, SCROLLBAR_COLOR, bar_rect, border_radius=2)
@@ -1,51 +1,97 @@
-import json
-import os
 import time
 
+from game.registry import PlayerRegistry, iter_player_file
+from game.stats import RoundStats
+from game.storage import open_store
+
 
 class GameManager:
-    def __init__(self, data_path):
+    def __init__(self, data_path, time_source=time.perf_counter, save_delay=0.5):
         self.data_path = data_path
-        self.players = []
+        # 확장자에 따라 JSON 파일 또는 SQLite 저장소 사용 (.db/.sqlite/.sqlite3)
+        self.store = open_store(data_path, save_delay)
+        self.time_source = time_source  # 단조 증가 시계 (게임 시계와 공유 가능)
+        # 플레이어 목록과 가중치 (등록 순서 유지, O(1) 조회)
+        self.players = PlayerRegistry()
         self.current_player = None
         self.current_question = None
         self.timer_start = 0
         self.timer_duration = 10  # 10초 타이머
+        # 라운드 결과 통계 (최근 기록과 누적 집계)
+        self.stats = RoundStats(max_response_time=self.timer_duration)
         self.load_players()
+        # 플레이어가 바뀔 때마다 저장소에 반영
+        self.players.subscribe(self.on_players_changed)
 
     def load_players(self):
         """플레이어 데이터 로드"""
-        try:
-            if os.path.exists(self.data_path):
-                with open(self.data_path, "r", encoding="utf-8") as f:
-                    self.players = json.load(f)
-        except Exception as e:
-            print(f"플레이어 데이터 로드 실패: {e}")
-            self.players = []
+        names, weights = self.store.load()
+        self.players.add(names, weights, notify=False)
 
     def save_players(self):
-        """플레이어 데이터 저장"""
-        try:
-            with open(self.data_path, "w", encoding="utf-8") as f:
-                json.dump(self.players, f, ensure_ascii=False)
-        except Exception as e:
-            print(f"플레이어 데이터 저장 실패: {e}")
+        """플레이어 목록 전체 저장"""
+        self.store.save_players(self.players)
+
+    def on_players_changed(self, kind, names):
+        """플레이어 변경 사항을 저장소에 반영"""
+        self.store.players_changed(self.players, kind, names)
+
+    def flush(self):
+        """예약된 저장을 즉시 디스크에 기록"""
+        self.store.flush()
+
+    def close(self):
+        """종료 전 남은 데이터를 저장하고 저장소 정리"""
+        self.store.close()
 
     def add_player(self, name):
         """플레이어 추가"""
-        if name and name not in self.players:
-            self.players.append(name)
-            self.save_players()
-            return True
-        return False
+        return bool(self.add_players([name]))
 
     def remove_player(self, name):
         """플레이어 제거"""
-        if name in self.players:
-            self.players.remove(name)
-            self.save_players()
-            return True
-        return False
+        return bool(self.remove_players([name]))
+
+    def add_players(self, names, weights=None):
+        """여러 플레이어를 한 번에 추가 (저장과 변경 알림은 한 번만)"""
+        return self.players.add(names, weights)
+
+    def remove_players(self, names):
+        """여러 플레이어를 한 번에 제거 (저장과 변경 알림은 한 번만)"""
+        return self.players.remove(names)
+
+    def import_players(self, path, batch_size=1000):
+        """CSV/JSON Lines 파일에서 플레이어를 읽어 batch_size명씩 추가"""
+        added_count = 0
+        names = []
+        weights = {}
+        try:
+            for name, weight in iter_player_file(path):
+                names.append(name)
+                if weight != 1.0:
+                    weights[name] = weight
+                if len(names) >= batch_size:
+                    added_count += len(self.add_players(names, weights))
+                    names = []
+                    weights = {}
+        except (OSError, UnicodeDecodeError) as e:
+            # 형식이 잘못된 줄은 iter_player_file에서 건너뛰므로 파일을 읽지 못한 경우만
+            print(f"플레이어 파일 가져오기 실패: {e}")
+        if names:
+            added_count += len(self.add_players(names, weights))
+        return added_count
+
+    def get_weight(self, name):
+        """플레이어의 룰렛 가중치 (기본값 1.0)"""
+        return self.players.get_weight(name)
+
+    def set_weight(self, name, weight):
+        """플레이어의 룰렛 가중치 설정 (예: 많이 마신 사람은 낮게, 생일자는 높게)"""
+        return self.players.set_weight(name, weight)
+
+    def get_weights(self):
+        """플레이어 목록 순서에 맞춘 가중치 목록"""
+        return self.players.weight_list()
 
     def set_current_player(self, player):
         """현재 지목된 플레이어 설정"""
@@ -57,14 +103,29 @@ class GameManager:
 
     def start_timer(self):
         """타이머 시작"""
-        self.timer_start = time.time()
+        self.timer_start = self.time_source()
 
     def get_remaining_time(self):
         """남은 시간 계산"""
-        elapsed = time.time() - self.timer_start
+        elapsed = self.time_source() - self.timer_start
         remaining = max(0, self.timer_duration - elapsed)
         return remaining
 
+    def record_round(self, answered):
+        """현재 라운드 결과를 기록하고 응답 시간(초) 반환
+
+        answered: 시간 안에 대답했는지 여부
+        """
+        if answered:
+            response_time = self.timer_duration - self.get_remaining_time()
+        else:
+            response_time = self.timer_duration
+        self.stats.record(self.current_player, answered, response_time)
+        self.store.record_round(
+            self.current_player, self.current_question, answered, response_time
+        )
+        return response_time
+
     def is_time_up(self):
         """시간 초과 여부 확인"""
         return self.get_remaining_time() <= 0
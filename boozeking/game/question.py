@@ -1,7 +1,16 @@
 import random
+from bisect import bisect_right
+
+from game.question_bank import QuestionBank, ShuffleBag
+
+# 코드에 들어 있는 기본 질문의 카테고리 이름
+BUILTIN_CATEGORY = "기본"
+
 
 class QuestionManager:
-    def __init__(self):
+    def __init__(self, rng=random):
+        self.rng = rng
+
         # 기본 질문 목록 (한국어로 변경)
         self.questions = [
             "가장 최근에 술 마신 날은?",
@@ -13,20 +22,101 @@ class QuestionManager:
             "지금까지 마신 술 중 최고 도수는?",
             "술자리에서 가장 싫어하는 유형은?",
             "술 마시고 한 최악의 결정은?",
-            "술자리에서 지켜야 할 예의는?"
+            "술자리에서 지켜야 할 예의는?",
         ]
-    
-    def get_random_question(self):
-        """랜덤 질문 반환"""
-        return random.choice(self.questions)
-    
+        # 질문 -> 목록 위치 (O(1) 삭제용)
+        self._question_index = {q: i for i, q in enumerate(self.questions)}
+
+        # 파일에서 불러온 질문 모음과 카테고리 조합별 셔플 백
+        self.banks = []
+        self._bags = {}
+
+    def load_bank(self, path):
+        """질문 파일(또는 *.txt 파일이 있는 디렉토리) 추가, 추가된 카테고리 반환"""
+        bank = QuestionBank(path)
+        self.banks.append(bank)
+        self._bags.clear()
+        return bank.categories()
+
+    def categories(self):
+        """사용 가능한 카테고리 목록"""
+        categories = [BUILTIN_CATEGORY]
+        for bank in self.banks:
+            categories.extend(bank.categories())
+        return categories
+
+    def _sources(self, categories):
+        """선택된 카테고리의 질문 목록들"""
+        sources = []
+        if categories is None or BUILTIN_CATEGORY in categories:
+            sources.append(self.questions)
+        for bank in self.banks:
+            for category, question_file in bank.files.items():
+                if categories is None or category in categories:
+                    sources.append(question_file)
+        return sources
+
+    def _bag(self, categories):
+        """카테고리 조합별 셔플 백 (질문 목록이 바뀌면 다시 만듦)"""
+        key = None if categories is None else frozenset(categories)
+        entry = self._bags.get(key)
+        if entry is None:
+            sources = self._sources(key)
+            ends = []
+            total = 0
+            for source in sources:
+                total += len(source)
+                ends.append(total)
+            entry = (sources, ends, ShuffleBag(total, self.rng))
+            self._bags[key] = entry
+        return entry
+
+    def prepare(self, categories=None):
+        """질문 파일 색인과 셔플 백을 미리 만들어 둠 (첫 질문을 뽑을 때 멈추지 않도록)
+
+        로드 스레드에서 호출하며, 질문 개수를 반환합니다.
+        """
+        if isinstance(categories, str):
+            categories = (categories,)
+        return self._bag(categories)[2].size
+
+    def get_random_question(self, categories=None):
+        """랜덤 질문 반환 (한 바퀴를 다 돌기 전에는 같은 질문이 나오지 않음)
+
+        categories는 카테고리 이름 하나 또는 이름 목록 (질문이 없으면 None 반환)
+        """
+        if isinstance(categories, str):
+            # 문자열을 그대로 쓰면 글자 단위로 나뉘므로 카테고리 하나로 취급
+            categories = (categories,)
+        sources, ends, bag = self._bag(categories)
+        if bag.size == 0:
+            return None
+
+        # 전체 번호를 질문 목록과 목록 안의 위치로 변환
+        index = bag.draw()
+        source_index = bisect_right(ends, index)
+        start = ends[source_index - 1] if source_index > 0 else 0
+        return sources[source_index][index - start]
+
     def add_question(self, question):
         """새 질문 추가"""
+        if question in self._question_index:
+            return False
+        self._question_index[question] = len(self.questions)
         self.questions.append(question)
-        
+        self._bags.clear()
+        return True
+
     def remove_question(self, question):
         """질문 삭제"""
-        if question in self.questions:
-            self.questions.remove(question)
-            return True
-        return False
+        index = self._question_index.pop(question, None)
+        if index is None:
+            return False
+
+        # 마지막 질문을 삭제된 자리로 옮겨 O(1)에 삭제
+        last = self.questions.pop()
+        if index < len(self.questions):
+            self.questions[index] = last
+            self._question_index[last] = index
+        self._bags.clear()
+        return True
@@ -0,0 +1,130 @@
+import mmap
+import os
+import random
+from array import array
+
+
+class ShuffleBag:
+    """한 바퀴를 다 뽑기 전에는 같은 번호가 다시 나오지 않는 O(1) 무작위 추출기
+
+    섞는 작업을 미리 하지 않고 뽑을 때마다 Fisher-Yates 한 단계씩만 진행합니다.
+    """
+
+    def __init__(self, size, rng=random):
+        self.size = size
+        self.rng = rng
+        self._order = array("I", range(size))
+        self._remaining = size
+
+    def __len__(self):
+        """이번 바퀴에서 아직 뽑지 않은 개수"""
+        return self._remaining
+
+    def draw(self):
+        """다음 번호 하나를 뽑음 (다 뽑으면 새 바퀴 시작)"""
+        if self.size == 0:
+            raise IndexError("빈 목록에서는 뽑을 수 없습니다")
+        if self._remaining == 0:
+            self._remaining = self.size
+        pick = self.rng.randrange(self._remaining)
+        self._remaining -= 1
+        last = self._remaining
+        self._order[pick], self._order[last] = self._order[last], self._order[pick]
+        return self._order[last]
+
+
+class QuestionFile:
+    """질문 파일 하나 (한 줄에 질문 하나), mmap으로 열어 필요한 줄만 읽음"""
+
+    def __init__(self, path, category):
+        self.path = path
+        self.category = category
+        self._mmap = None
+        self._starts = None  # 각 줄의 시작 오프셋
+        self._ends = None  # 각 줄의 끝 오프셋 (줄바꿈 제외)
+
+    def _ensure_index(self):
+        """처음 접근할 때 파일을 mmap으로 열고 줄 오프셋 색인 생성"""
+        if self._starts is not None:
+            return
+
+        self._starts = array("Q")
+        self._ends = array("Q")
+        if os.path.getsize(self.path) == 0:
+            return
+
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data = self._mmap
+        size = len(data)
+        position = 3 if data[:3] == b"\xef\xbb\xbf" else 0  # UTF-8 BOM 건너뜀
+        line_number = 0
+        while position < size:
+            line_number += 1
+            newline = data.find(b"\n", position)
+            if newline == -1:
+                newline = size
+            end = newline
+            if end > position and data[end - 1 : end] == b"\r":
+                end -= 1
+            # UTF-8이 아닌 줄은 뽑혔을 때 게임이 멈추지 않도록 색인할 때 건너뜀
+            try:
+                text = data[position:end].decode("utf-8")
+            except UnicodeDecodeError as e:
+                print(
+                    f"{self.path}:{line_number}: UTF-8이 아닌 줄을 건너뜀 ({e.reason})"
+                )
+                text = ""
+            # 빈 줄은 색인하지 않음
+            if text.strip():
+                self._starts.append(position)
+                self._ends.append(end)
+            position = newline + 1
+
+    def __len__(self):
+        self._ensure_index()
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        self._ensure_index()
+        return (
+            self._mmap[self._starts[index] : self._ends[index]].decode("utf-8").strip()
+        )
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._starts = None
+        self._ends = None
+
+
+class QuestionBank:
+    """파일 또는 디렉토리에서 불러오는 질문 모음
+
+    디렉토리를 주면 그 안의 *.txt 파일을 각각 하나의 카테고리로 사용합니다
+    (예: data/questions/ko.txt -> "ko"). 파일 내용은 처음 사용할 때 색인합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        if os.path.isdir(path):
+            for filename in sorted(os.listdir(path)):
+                if filename.endswith(".txt"):
+                    category = os.path.splitext(filename)[0]
+                    self.files[category] = QuestionFile(
+                        os.path.join(path, filename), category
+                    )
+        else:
+            category = os.path.splitext(os.path.basename(path))[0]
+            self.files[category] = QuestionFile(path, category)
+
+    def categories(self):
+        """카테고리 이름 목록"""
+        return list(self.files)
+
+    def close(self):
+        for question_file in self.files.values():
+            question_file.close()
@@ -0,0 +1,170 @@
+import csv
+import json
+import math
+import os
+
+
+def is_valid_weight(weight):
+    """룰렛 가중치로 쓸 수 있는 값인지 (0보다 큰 유한한 수)"""
+    if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+        return False
+    return math.isfinite(weight) and weight > 0
+
+
+class PlayerRegistry:
+    """등록 순서를 유지하면서 O(1)로 조회/추가/삭제할 수 있는 플레이어 목록
+
+    이름 -> 가중치 딕셔너리(삽입 순서 유지)를 인덱스로 사용하고, 순서대로 접근할 때
+    쓰는 리스트는 목록이 바뀐 뒤 처음 필요할 때 한 번만 다시 만듭니다.
+    """
+
+    def __init__(self, names=(), weights=None):
+        self._weights = {}
+        self._ordered = None  # 순서 있는 이름 목록 캐시
+        self._listeners = []
+        self.add(names, weights, notify=False)
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __iter__(self):
+        return iter(self.as_list())
+
+    def __contains__(self, name):
+        return name in self._weights
+
+    def __getitem__(self, index):
+        return self.as_list()[index]
+
+    def as_list(self):
+        """등록 순서대로 정렬된 이름 목록 (수정하지 말 것)"""
+        if self._ordered is None:
+            self._ordered = list(self._weights)
+        return self._ordered
+
+    def subscribe(self, callback):
+        """목록 변경 알림 등록 (callback(kind, names), kind: add/remove/weights)"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        """목록 변경 알림 해제"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, kind, names):
+        for callback in list(self._listeners):
+            callback(kind, names)
+
+    def add(self, names, weights=None, notify=True):
+        """여러 플레이어를 한 번에 추가하고 실제로 추가된 이름 목록 반환
+
+        가중치가 0 이하이거나 유한하지 않으면 기본값(1.0)으로 추가합니다 (저장된
+        플레이어가 가중치 때문에 목록과 파일에서 사라지지 않도록).
+        """
+        weights = weights or {}
+        added = []
+        for name in names:
+            if name and name not in self._weights:
+                weight = weights.get(name, 1.0)
+                if not is_valid_weight(weight):
+                    print(f"잘못된 가중치라 기본값으로 추가함: {name} ({weight})")
+                    weight = 1.0
+                self._weights[name] = weight
+                added.append(name)
+        if added:
+            if self._ordered is not None:
+                self._ordered.extend(added)
+            if notify:
+                self._notify("add", added)
+        return added
+
+    def remove(self, names, notify=True):
+        """여러 플레이어를 한 번에 삭제하고 실제로 삭제된 이름 목록 반환"""
+        removed = []
+        for name in names:
+            if name in self._weights:
+                del self._weights[name]
+                removed.append(name)
+        if removed:
+            self._ordered = None
+            if notify:
+                self._notify("remove", removed)
+        return removed
+
+    def get_weight(self, name):
+        """플레이어의 룰렛 가중치 (기본값 1.0)"""
+        return self._weights.get(name, 1.0)
+
+    def set_weight(self, name, weight):
+        """플레이어의 룰렛 가중치 설정"""
+        if name not in self._weights or not is_valid_weight(weight):
+            return False
+        self._weights[name] = weight
+        self._notify("weights", [name])
+        return True
+
+    def weight_list(self):
+        """등록 순서에 맞춘 가중치 목록"""
+        return list(self._weights.values())
+
+    def custom_weights(self):
+        """기본값(1.0)이 아닌 가중치만 모은 딕셔너리 (저장용)"""
+        return {name: w for name, w in self._weights.items() if w != 1.0}
+
+
+def iter_player_file(path):
+    """CSV 또는 JSON Lines 파일에서 (이름, 가중치)를 한 줄씩 읽어 옴
+
+    - CSV: 첫 번째 열이 이름, 두 번째 열(선택)이 가중치. "name" 헤더는 건너뜀
+    - JSON Lines(.jsonl/.ndjson): 한 줄에 "이름" 또는 {"name": ..., "weight": ...}
+
+    형식이 잘못되었거나 가중치가 0 이하/유한하지 않은 줄은 줄 번호와 함께 알리고
+    건너뜁니다.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if extension in (".jsonl", ".ndjson"):
+            rows = enumerate(f, 1)
+            parse = _parse_jsonl_line
+        else:
+            reader = csv.reader(f)
+            rows = ((reader.line_num, row) for row in reader)
+            parse = _parse_csv_row
+
+        for line_number, row in rows:
+            try:
+                entry = parse(row)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"{path}:{line_number}: 잘못된 줄을 건너뜀 ({e!r})")
+                continue
+            if entry is None:
+                continue
+            name, weight = entry
+            if not is_valid_weight(weight):
+                print(
+                    f"{path}:{line_number}: 잘못된 가중치를 건너뜀 ({name}, {weight})"
+                )
+                continue
+            yield name, weight
+
+
+def _parse_jsonl_line(line):
+    """JSON Lines 한 줄을 (이름, 가중치)로 변환 (빈 줄이면 None)"""
+    line = line.strip()
+    if not line:
+        return None
+    record = json.loads(line)
+    if isinstance(record, str):
+        return record, 1.0
+    return str(record["name"]), float(record.get("weight", 1.0))
+
+
+def _parse_csv_row(row):
+    """CSV 한 행을 (이름, 가중치)로 변환 (빈 행이나 헤더면 None)"""
+    if not row or not row[0].strip():
+        return None
+    name = row[0].strip()
+    if name.lower() == "name":
+        return None
+    weight = float(row[1]) if len(row) > 1 and row[1].strip() else 1.0
+    return name, weight
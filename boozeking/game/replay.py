@@ -0,0 +1,164 @@
+"""입력 기록과 재생
+
+게임 루프가 처리한 pygame 이벤트와 프레임별 델타 타임, 난수 시드, 시작 시점의
+플레이어 목록을 작은 바이너리 파일로 기록합니다. 같은 파일을 재생하면 같은 입력이
+같은 게임 시간에 들어가므로 룰렛 결과와 화면 흐름이 그대로 재현됩니다.
+
+파일 형식 (리틀 엔디언)
+    헤더: b"BKRP", 버전(u8), 시드(u64), 플레이어 JSON 길이(u32), 플레이어 JSON
+    프레임: 델타 타임(f64), 이벤트 수(u16), 이벤트...
+    이벤트: 종류(u16) + 종류별 데이터 (키: 키 코드 u32, 수식키 u16, 문자 길이 u8,
+            UTF-8 문자 / 마우스 버튼: x, y(i16), 버튼(u8) / 휠: x, y(i16))
+"""
+
+import json
+import struct
+
+import pygame
+from pygame.locals import KEYDOWN, MOUSEBUTTONDOWN, MOUSEWHEEL
+
+MAGIC = b"BKRP"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBQI")
+FRAME = struct.Struct("<dH")
+EVENT_TYPE = struct.Struct("<H")
+KEY_EVENT = struct.Struct("<IHB")
+BUTTON_EVENT = struct.Struct("<hhB")
+WHEEL_EVENT = struct.Struct("<hh")
+
+
+class ReplayRecorder:
+    """프레임마다 (델타 타임, 이벤트 목록)을 파일에 이어 씀
+
+    record_types에 있는 이벤트 종류만 기록합니다 (게임이 처리하지 않는 마우스 이동
+    등은 재생 결과에 영향이 없으므로 버림).
+    """
+
+    def __init__(self, path, seed, players, weights, record_types):
+        self.path = path
+        self.record_types = set(record_types)
+        self.frames = 0
+        self._file = open(path, "wb")
+        roster = json.dumps(
+            {"players": list(players), "weights": list(weights)}, ensure_ascii=False
+        ).encode("utf-8")
+        self._file.write(HEADER.pack(MAGIC, VERSION, seed, len(roster)))
+        self._file.write(roster)
+
+    def record(self, dt, events):
+        """한 프레임 기록"""
+        events = [event for event in events if event.type in self.record_types]
+        chunks = [FRAME.pack(dt, len(events))]
+        for event in events:
+            chunks.append(EVENT_TYPE.pack(event.type))
+            chunks.append(_pack_event(event))
+        self._file.write(b"".join(chunks))
+        self.frames += 1
+
+    def close(self):
+        """남은 기록을 파일에 쓰고 닫기"""
+        if not self._file.closed:
+            self._file.close()
+
+
+def _pack_event(event):
+    if event.type == KEYDOWN:
+        text = event.unicode.encode("utf-8")[:255]
+        return KEY_EVENT.pack(event.key, event.mod & 0xFFFF, len(text)) + text
+    if event.type == MOUSEBUTTONDOWN:
+        x, y = event.pos
+        return BUTTON_EVENT.pack(x, y, event.button)
+    if event.type == MOUSEWHEEL:
+        return WHEEL_EVENT.pack(event.x, event.y)
+    # 종료, 창 노출, 타이머 이벤트 등은 종류만으로 충분
+    return b""
+
+
+class ReplayLog:
+    """기록 파일을 읽어 시드, 플레이어 목록, 프레임 목록으로 보관"""
+
+    def __init__(self, seed, players, weights, frames):
+        self.seed = seed
+        self.players = players
+        self.weights = weights
+        self.frames = frames  # [(델타 타임, [pygame 이벤트])]
+
+    @classmethod
+    def load(cls, path):
+        """기록 파일 읽기 (기록 중 비정상 종료로 잘린 마지막 프레임은 버림)"""
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic, version, seed, roster_size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"지원하지 않는 리플레이 파일입니다: {path}")
+        offset = HEADER.size
+        roster = json.loads(data[offset : offset + roster_size].decode("utf-8"))
+        offset += roster_size
+
+        frames = []
+        try:
+            while offset < len(data):
+                dt, count = FRAME.unpack_from(data, offset)
+                offset += FRAME.size
+                events = []
+                for _ in range(count):
+                    event, offset = _unpack_event(data, offset)
+                    events.append(event)
+                frames.append((dt, events))
+        except struct.error:
+            print(f"리플레이 파일 끝이 잘려 있어 {len(frames)}프레임까지만 재생합니다")
+        return cls(seed, roster["players"], roster["weights"], frames)
+
+
+def _unpack_event(data, offset):
+    (event_type,) = EVENT_TYPE.unpack_from(data, offset)
+    offset += EVENT_TYPE.size
+    if event_type == KEYDOWN:
+        key, mod, length = KEY_EVENT.unpack_from(data, offset)
+        offset += KEY_EVENT.size
+        text = data[offset : offset + length].decode("utf-8")
+        offset += length
+        return pygame.event.Event(event_type, key=key, mod=mod, unicode=text), offset
+    if event_type == MOUSEBUTTONDOWN:
+        x, y, button = BUTTON_EVENT.unpack_from(data, offset)
+        offset += BUTTON_EVENT.size
+        return pygame.event.Event(event_type, pos=(x, y), button=button), offset
+    if event_type == MOUSEWHEEL:
+        x, y = WHEEL_EVENT.unpack_from(data, offset)
+        offset += WHEEL_EVENT.size
+        return pygame.event.Event(event_type, x=x, y=y, flipped=False), offset
+    return pygame.event.Event(event_type), offset
+
+
+class ReplayReport:
+    """재생 결과 요약 (성능 회귀 확인용 프레임 시간 포함)"""
+
+    def __init__(self, frames, game_time, elapsed, frame_times, state, player):
+        self.frames = frames
+        self.game_time = game_time
+        self.elapsed = elapsed
+        self.frame_times = sorted(frame_times)
+        self.state = state
+        self.player = player
+
+    def percentile(self, q):
+        """프레임 처리 시간의 q 백분위수 (초)"""
+        if not self.frame_times:
+            return 0.0
+        index = min(len(self.frame_times) - 1, int(len(self.frame_times) * q / 100))
+        return self.frame_times[index]
+
+    def format(self):
+        fps = self.frames / self.elapsed if self.elapsed > 0 else float("inf")
+        return "\n".join(
+            [
+                f"{self.frames}프레임 (게임 시간 {self.game_time:.2f}초)을"
+                f" {self.elapsed:.3f}초에 재생 ({fps:,.0f}프레임/초)",
+                f"프레임 처리 시간: 중앙값 {self.percentile(50) * 1000:.3f}ms,"
+                f" p99 {self.percentile(99) * 1000:.3f}ms,"
+                f" 최대 {self.percentile(100) * 1000:.3f}ms",
+                f"마지막 상태: {self.state}, 지목된 플레이어: {self.player}",
+            ]
+        )
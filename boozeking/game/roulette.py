@@ -2,19 +2,65 @@ import pygame
 import random
 import math
 
+from game.geometry import ARC_QUALITY, wheel_geometry
+from game.roulette_model import POINTER_ANGLE, RouletteModel
+
 # gfxdraw를 사용하려면 import 필요 (선택 사항)
 # from pygame import gfxdraw
 
+# 다양한 색상 팔레트 (플레이어 수에 따라 유연하게 선택)
+BASE_COLORS = [
+    (255, 100, 100),
+    (100, 255, 100),
+    (100, 100, 255),
+    (255, 255, 100),
+    (255, 100, 255),
+    (100, 255, 255),
+    (255, 150, 50),
+    (150, 50, 255),
+    (50, 255, 150),
+]
+
+# 텍스트 위치 (0.0 ~ 1.0, 1.0은 가장자리)
+LABEL_RADIUS_FACTOR = 0.7
+
+# 참가자가 많을 때의 상세도 조절
+LABEL_ALL_LIMIT = 24  # 이 인원까지는 모든 이름 표시, 넘으면 화살표 주변만 표시
+LABEL_NEIGHBOURS = 2  # 화살표 아래 세그먼트 양옆으로 표시할 이름 수
+MIN_SEGMENT_DEGREES = 2.0  # 이보다 얇은 세그먼트는 묶어서 하나의 부채꼴로 그림
 
-class Roulette:
-    def __init__(self, screen, players, font_small):  # font_small을 인자로 받도록 수정
+
+class Roulette(RouletteModel):
+    """RouletteModel을 화면에 그리는 룰렛"""
+
+    def __init__(
+        self,
+        screen,
+        players,
+        font_small,
+        rotation_step=None,
+        text_cache=None,
+        quality="high",
+        weights=None,
+        rng=random,
+    ):  # font_small을 인자로 받도록 수정
+        super().__init__(players, weights, rng)
         self.screen = screen
-        self.players = players
         self.font_small = font_small  # UI 모듈의 폰트를 사용
-        self.angle = 0
-        self.spinning = False
-        self.spin_speed = 0
-        self.selected_player = None
+        self.text_cache = text_cache  # UI 모듈의 텍스트 캐시를 공유 (선택 사항)
+
+        # 회전 프레임 캐시 간격 (도 단위, None이면 매 프레임 실시간 회전)
+        self.rotation_step = rotation_step
+
+        # 미리 그려둔 룰렛 휠 캐시 (플레이어 목록/반지름/폰트가 바뀔 때만 재생성)
+        self._wheel_key = None
+        self._wheel_surface = None
+        self._label_surfaces = []
+        self._label_offsets = []
+        self._label_widths = {}  # 이름 -> 라벨 폭 (새로 추가된 이름만 측정)
+        self._label_font = None
+        self._max_label_width = 0
+        self._rotation_cache = {}
 
         # 화면의 너비와 높이
         screen_width = screen.get_width()
@@ -37,6 +83,10 @@ class Roulette:
         )  # 위아래 여백 20px 추가 고려
         self.radius = max(50, self.radius)  # 최소 반지름 보장
 
+        # 반지름별 원 둘레 좌표 테이블 (호 해상도는 quality로 조절)
+        self.quality = quality
+        self.geometry = wheel_geometry(self.radius, ARC_QUALITY[quality])
+
         # 룰렛 중심 Y좌표: 타이틀 하단 + 룰렛 반지름 + 상단 여백
         title_bottom_y = (
             60 + self.font_small.get_height() // 2
@@ -46,112 +96,193 @@ class Roulette:
             title_bottom_y + self.radius + 30,  # 타이틀과 룰렛 사이 여백 30px
         )
 
-    def start_spin(self):
-        """룰렛 회전 시작"""
-        self.spinning = True
-        self.spin_speed = random.uniform(10, 20)  # 초기 회전 속도
-        self.selected_player = None
+    def segment_at_point(self, pos):
+        """화면 좌표 아래에 있는 세그먼트 인덱스 (룰렛 밖이면 None)"""
+        dx = pos[0] - self.center[0]
+        dy = pos[1] - self.center[1]
+        if dx * dx + dy * dy > self.radius * self.radius:
+            return None
+        screen_angle = math.degrees(math.atan2(dy, dx))
+        return self.segment_at(screen_angle - self.angle)
 
-    def update(self):
-        """룰렛 상태 업데이트"""
-        if self.spinning:
-            self.angle += self.spin_speed
-            self.spin_speed *= 0.98  # 점차 감속
+    def get_rect(self):
+        """룰렛(라벨과 화살표 포함)이 그려지는 화면 영역"""
+        if not self.players:
+            return self.screen.get_rect()
 
-            if self.spin_speed < 0.1:
-                self.spinning = False
-                self.select_player()
+        self._ensure_wheel()
+        # 라벨이 휠 바깥으로 삐져나올 수 있으므로 가장 큰 라벨 폭만큼 여유를 둠
+        label_width = self._max_label_width
+        overhang = label_width // 2 - int(self.radius * (1 - LABEL_RADIUS_FACTOR))
+        half_size = self.radius + max(4, overhang)
+        rect = pygame.Rect(0, 0, half_size * 2, half_size * 2)
+        rect.center = self.center
+        # 화살표 영역 포함 (휠 상단에서 약 20px 위)
+        arrow_top = self.center[1] - self.radius - 25
+        if arrow_top < rect.top:
+            rect.height += rect.top - arrow_top
+            rect.top = arrow_top
+        return rect
 
-    def select_player(self):
-        """룰렛이 멈추면 플레이어 선택"""
-        if not self.players:
-            return None
+    def _render_text(self, text, color):
+        """텍스트 렌더링 (텍스트 캐시가 있으면 사용)"""
+        if self.text_cache is not None:
+            return self.text_cache.render(self.font_small, text, color)
+        return self.font_small.render(text, True, color)
 
-        segment_angle = 360 / len(self.players)
-        normalized_angle = self.angle % 360
-        selected_index = int(normalized_angle / segment_angle)
-        self.selected_player = self.players[selected_index]
-        return self.selected_player
+    def is_large_roster(self):
+        """참가자가 많아 화살표 주변 이름만 표시하는 모드인지 확인"""
+        return len(self.players) > LABEL_ALL_LIMIT
 
-    def draw(self):
-        """룰렛 그리기"""
-        if not self.players:
-            # 플레이어가 없을 경우 안내 문구 표시
-            text = self.font_small.render(
-                "플레이어를 등록해주세요", True, (100, 100, 100)
-            )
-            text_rect = text.get_rect(
-                center=(self.screen.get_width() // 2, self.screen.get_height() // 2)
+    def _build_wheel(self):
+        """룰렛 휠을 오프스크린 Surface에 한 번만 그려 둠 (각도 0 기준)"""
+        num_segments = len(self.players)
+
+        # 테두리 두께만큼 여유를 두고 투명 Surface 생성
+        size = self.radius * 2 + 4
+        center = (size // 2, size // 2)
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        # 너무 얇은 세그먼트는 여러 개를 묶어 하나의 부채꼴로 그림
+        group_size = max(1, math.ceil(MIN_SEGMENT_DEGREES * num_segments / 360))
+        for group, first in enumerate(range(0, num_segments, group_size)):
+            last = min(first + group_size, num_segments) - 1
+            # 각 세그먼트(묶음)의 시작 각도와 끝 각도 (도 단위)
+            start_angle_deg = self.segment_bounds(first)[0]
+            end_angle_deg = self.segment_bounds(last)[1]
+
+            # 부채꼴을 그리기 위한 점들 (미리 계산한 좌표 테이블에서 잘라 옴)
+            points = self.geometry.sector_polygon(
+                center, start_angle_deg, end_angle_deg
             )
-            self.screen.blit(text, text_rect)
-            return
 
-        # 룰렛 배경 원 그리기 (테두리 효과를 위해 약간 더 크게)
-        # pygame.draw.circle(self.screen, (50, 50, 50), self.center, self.radius + 3) # 어두운 테두리
-        # pygame.draw.circle(self.screen, (220, 220, 220), self.center, self.radius) # 밝은 배경
+            if len(points) > 2:  # 다각형을 그리려면 최소 3개의 점 필요
+                color = BASE_COLORS[group % len(BASE_COLORS)]
+                pygame.draw.polygon(surface, color, points)
+                # 경계선 추가 (검은색, 세그먼트가 많으면 중심부가 뭉개지므로 생략)
+                if not self.is_large_roster():
+                    pygame.draw.lines(surface, (0, 0, 0), False, points, 2)
+
+        if self.is_large_roster():
+            # 바깥 테두리만 한 번 그림
+            pygame.draw.circle(surface, (0, 0, 0), center, self.radius, 2)
+
+        # 플레이어 이름은 회전하지 않도록 휠과 별도로 렌더링해 둠
+        # (참가자가 많으면 매 프레임 화살표 주변 이름만 그리므로 미리 만들지 않음)
+        self._label_surfaces = []
+        self._label_offsets = []
+        self._max_label_width = self._update_label_widths()
+        if not self.is_large_roster():
+            for i, player in enumerate(self.players):
+                # 텍스트를 부채꼴의 중간 각도, 바깥쪽에 가깝게 위치
+                start_angle_deg, end_angle_deg = self.segment_bounds(i)
+                self._label_offsets.append(
+                    self.geometry.point_at(
+                        (start_angle_deg + end_angle_deg) / 2, LABEL_RADIUS_FACTOR
+                    )
+                )
+                self._label_surfaces.append(
+                    self._render_text(player, (0, 0, 0))  # 검은색 텍스트
+                )
+
+        self._wheel_surface = surface
+        self._rotation_cache = {}
 
+    def _update_label_widths(self):
+        """가장 큰 라벨 폭 (폭 캐시에 없는 이름만 측정하고 삭제된 이름은 정리)"""
+        if self._label_font is not self.font_small:
+            self._label_widths = {}
+            self._label_font = self.font_small
+        widths = self._label_widths
+        for player in self.players:
+            if player not in widths:
+                widths[player] = self.font_small.size(str(player))[0]
+        if len(widths) > len(self.players):
+            for player in set(widths) - set(self.players):
+                del widths[player]
+        return max(widths.values(), default=0)
+
+    def _draw_pointer_labels(self):
+        """참가자가 많을 때 화살표 아래 세그먼트와 양옆 이름만 순서대로 표시"""
         num_segments = len(self.players)
-        segment_angle_degrees = 360 / num_segments
-
-        # 다양한 색상 팔레트 (플레이어 수에 따라 유연하게 선택)
-        base_colors = [
-            (255, 100, 100),
-            (100, 255, 100),
-            (100, 100, 255),
-            (255, 255, 100),
-            (255, 100, 255),
-            (100, 255, 255),
-            (255, 150, 50),
-            (150, 50, 255),
-            (50, 255, 150),
+        pointer_index = self.pointer_segment()
+        indexes = [
+            (pointer_index + offset) % num_segments
+            for offset in range(-LABEL_NEIGHBOURS, LABEL_NEIGHBOURS + 1)
+            if abs(offset) < num_segments
         ]
-        colors = [base_colors[i % len(base_colors)] for i in range(num_segments)]
-
-        for i, player in enumerate(self.players):
-            # 각 세그먼트의 시작 각도와 끝 각도 (도 단위)
-            start_angle_deg = self.angle + i * segment_angle_degrees
-            end_angle_deg = self.angle + (i + 1) * segment_angle_degrees
-
-            # 부채꼴을 그리기 위한 점들 계산
-            points = [self.center]
-            # 호를 따라 점들을 추가 (더 부드러운 곡선을 위해 점 개수 늘릴 수 있음)
-            for angle_deg in range(
-                int(start_angle_deg), int(end_angle_deg) + 1, 1
-            ):  # 1도 간격으로 점 생성
-                rad = math.radians(angle_deg)
-                x = self.center[0] + int(self.radius * math.cos(rad))
-                y = self.center[1] + int(self.radius * math.sin(rad))
-                points.append((x, y))
-            points.append(self.center)  # 부채꼴을 닫기 위해 중앙점 다시 추가
+        surfaces = [self._render_text(self.players[i], (0, 0, 0)) for i in indexes]
 
-            if len(points) > 2:  # 다각형을 그리려면 최소 3개의 점 필요
-                pygame.draw.polygon(self.screen, colors[i], points)
-                # 경계선 추가 (검은색)
-                pygame.draw.lines(self.screen, (0, 0, 0), False, points, 2)
+        # 세그먼트가 얇아 라벨이 겹치므로 화살표를 중심으로 라벨 폭만큼 간격을 벌림
+        label_radius = self.radius * LABEL_RADIUS_FACTOR
+        widest = max(surface.get_width() for surface in surfaces) + 8
+        spacing = math.degrees(widest / label_radius)
+        middle = len(surfaces) // 2
+        for slot, text_surface in enumerate(surfaces):
+            dx, dy = self.geometry.point_at(
+                POINTER_ANGLE + (slot - middle) * spacing, LABEL_RADIUS_FACTOR
+            )
+            text_rect = text_surface.get_rect(
+                center=(self.center[0] + dx, self.center[1] + dy)
+            )
+            # 알록달록한 휠 위에서도 읽히도록 흰 배경을 깔아 줌
+            pygame.draw.rect(
+                self.screen, (255, 255, 255), text_rect.inflate(6, 2), border_radius=3
+            )
+            self.screen.blit(text_surface, text_rect)
 
-            # 플레이어 이름 표시 (회전하지 않도록 수정)
-            # 텍스트를 부채꼴의 중간 각도, 바깥쪽에 가깝게 위치
-            text_angle_rad = math.radians(start_angle_deg + segment_angle_degrees / 2)
-            text_radius_factor = 0.7  # 텍스트 위치 (0.0 ~ 1.0, 1.0은 가장자리)
+    def _ensure_wheel(self):
+        """플레이어 목록, 반지름, 폰트, 품질이 바뀐 경우에만 휠 캐시 재생성"""
+        key = (self._roster_version, self.radius, self.font_small, self.quality)
+        if key != self._wheel_key:
+            self._build_wheel()
+            self._wheel_key = key
 
-            name_x = self.center[0] + int(
-                self.radius * text_radius_factor * math.cos(text_angle_rad)
+    def _rotated_wheel(self):
+        """현재 각도로 회전된 휠 Surface 반환"""
+        if not self.rotation_step:
+            # pygame의 회전은 반시계 방향이므로 부호를 반대로
+            return pygame.transform.rotate(self._wheel_surface, -self.angle)
+
+        # 회전 프레임 캐시: rotation_step 간격으로 양자화한 각도별로 한 번만 회전
+        frame_count = max(1, int(round(360 / self.rotation_step)))
+        frame = int(round(self.angle / self.rotation_step)) % frame_count
+        rotated = self._rotation_cache.get(frame)
+        if rotated is None:
+            rotated = pygame.transform.rotate(
+                self._wheel_surface, -frame * self.rotation_step
             )
-            name_y = self.center[1] + int(
-                self.radius * text_radius_factor * math.sin(text_angle_rad)
+            self._rotation_cache[frame] = rotated
+        return rotated
+
+    def draw(self):
+        """룰렛 그리기"""
+        if not self.players:
+            # 플레이어가 없을 경우 안내 문구 표시
+            text = self._render_text("플레이어를 등록해주세요", (100, 100, 100))
+            text_rect = text.get_rect(
+                center=(self.screen.get_width() // 2, self.screen.get_height() // 2)
             )
+            self.screen.blit(text, text_rect)
+            return
+
+        self._ensure_wheel()
 
-            # 텍스트 렌더링
-            text_surface = self.font_small.render(
-                player, True, (0, 0, 0)
-            )  # 검은색 텍스트
+        # 미리 그려둔 휠을 회전시켜 중심에 맞춰 블릿
+        rotated = self._rotated_wheel()
+        self.screen.blit(rotated, rotated.get_rect(center=self.center))
 
-            # 텍스트 회전 (선택 사항, 가독성 고려)
-            # rotated_text = pygame.transform.rotate(text_surface, -(start_angle_deg + segment_angle_degrees / 2) - 90)
-            # text_rect = rotated_text.get_rect(center=(name_x, name_y))
-            # self.screen.blit(rotated_text, text_rect)
+        # 플레이어 이름 표시 (회전하지 않도록 수정)
+        if self.is_large_roster():
+            self._draw_pointer_labels()
 
-            # 회전하지 않는 텍스트
+        # 각 라벨의 기준 위치를 현재 각도만큼 회전 (삼각함수는 프레임당 한 번만 계산)
+        rad = math.radians(self.angle)
+        cos_a = math.cos(rad)
+        sin_a = math.sin(rad)
+        for text_surface, (dx, dy) in zip(self._label_surfaces, self._label_offsets):
+            name_x = self.center[0] + int(dx * cos_a - dy * sin_a)
+            name_y = self.center[1] + int(dx * sin_a + dy * cos_a)
             text_rect = text_surface.get_rect(center=(name_x, name_y))
             self.screen.blit(text_surface, text_rect)
 
@@ -0,0 +1,313 @@
+import math
+import random
+from array import array
+from bisect import bisect_right
+
+from game.sampling import AliasTable
+
+# 회전 물리 설정 (프레임 레이트와 무관하게 초 단위로 정의)
+REFERENCE_FPS = 60  # 감속 비율과 초기 속도의 기준이 되는 프레임 레이트
+SPIN_DECAY = 0.98  # 기준 프레임당 감속 비율
+SPIN_DECAY_PER_SECOND = SPIN_DECAY**REFERENCE_FPS  # 1초 동안의 감속 비율
+SPIN_DECAY_RATE = -math.log(SPIN_DECAY_PER_SECOND)  # 지수 감속 계수 (1/초)
+SPIN_STOP_SPEED = 0.1 * REFERENCE_FPS  # 이 속도(도/초) 아래로 떨어지면 정지
+SPIN_TIME_STEP = 1 / REFERENCE_FPS  # 고정 시간 간격 모드의 스텝 크기 (초)
+POINTER_ANGLE = 270  # 화살표가 가리키는 화면 각도 (룰렛 상단)
+
+
+def spin_duration(speed):
+    """초기 속도(도/초)에서 정지할 때까지 걸리는 시간 (초)"""
+    if speed <= SPIN_STOP_SPEED:
+        return 0.0
+    return math.log(speed / SPIN_STOP_SPEED) / SPIN_DECAY_RATE
+
+
+def spin_distance(speed, elapsed):
+    """초기 속도(도/초)로 elapsed초 동안 지수 감속하며 회전한 총 각도"""
+    return speed * (1 - math.exp(-SPIN_DECAY_RATE * elapsed)) / SPIN_DECAY_RATE
+
+
+class RouletteModel:
+    """화면 없이 동작하는 룰렛 (플레이어 세그먼트, 회전 물리, 당첨자 선택)
+
+    pygame에 의존하지 않으므로 헤드리스 시뮬레이션과 테스트에 그대로 사용할 수 있고,
+    화면에 그리는 Roulette는 이 클래스를 상속합니다.
+    """
+
+    def __init__(self, players=(), weights=None, rng=random):
+        self.rng = rng
+        self.players = []
+        self.weights = []
+        self._roster_version = 0  # 플레이어 목록이 바뀔 때마다 증가 (캐시 무효화용)
+
+        # 세그먼트 테이블 (플레이어가 바뀔 때 바뀐 부분만 갱신)
+        self._positions = {}  # 이름 -> 세그먼트 인덱스
+        self._cumulative = array("d")  # 세그먼트별 누적 가중치 (이진 탐색용)
+        self._alias_table = None  # 가중치가 있을 때 당첨자를 뽑는 별칭 테이블
+        self._alias_dirty = True
+        self._registry = None
+
+        self.angle = 0
+        self.spinning = False
+        self.spin_speed = 0
+        self.selected_player = None
+
+        # 회전 시작 시 미리 계산해 두는 결과와 궤적
+        # (궤적은 고정 시간 간격으로 재생할 때만 필요하므로 처음 사용할 때 계산)
+        self.spin_trajectory = None
+        self.spin_frame = 0
+        self.spin_start_angle = 0
+        self.spin_initial_speed = 0
+        self.spin_elapsed = 0.0
+        self.spin_duration = 0.0
+        self.target_angle = 0
+        self.target_player = None
+
+        self.set_players(players, weights)
+
+    def start_spin(self, fast=False):
+        """룰렛 회전 시작 (멈출 각도와 선택될 플레이어를 미리 계산)"""
+        self.spinning = True
+        # 초기 회전 속도 (기준 프레임당 각도를 초당 각도로 변환)
+        self.spin_speed = self.rng.uniform(10, 20) * REFERENCE_FPS
+        self.selected_player = None
+
+        # 가중치가 있으면 당첨자를 먼저 뽑고 그 세그먼트에 멈추도록 초기 속도를 조정
+        self._ensure_alias_table()
+        if self._alias_table is not None:
+            self.spin_speed = self._steer_speed(
+                self.spin_speed, self._alias_table.sample(self.rng)
+            )
+
+        # 속도가 지수적으로 줄어들므로 정지 시간과 각도는 닫힌 식으로 결정됨
+        self.spin_start_angle = self.angle
+        self.spin_initial_speed = self.spin_speed
+        self.spin_elapsed = 0.0
+        self.spin_duration = spin_duration(self.spin_initial_speed)
+        self.target_angle = self.spin_start_angle + spin_distance(
+            self.spin_initial_speed, self.spin_duration
+        )
+        self.target_player = self.player_at_angle(self.target_angle)
+        self.spin_trajectory = None
+        self.spin_frame = 0
+
+        if fast:
+            self.skip_spin()
+
+    def _ensure_trajectory(self):
+        """고정 시간 간격으로 재생할 궤적 (마지막 값은 정확히 멈출 각도)"""
+        if self.spin_trajectory is None:
+            frames = max(1, math.ceil(self.spin_duration / SPIN_TIME_STEP))
+            self.spin_trajectory = array(
+                "d",
+                (
+                    self.spin_start_angle
+                    + spin_distance(self.spin_initial_speed, frame * SPIN_TIME_STEP)
+                    for frame in range(1, frames)
+                ),
+            )
+            self.spin_trajectory.append(self.target_angle)
+        return self.spin_trajectory
+
+    def _steer_speed(self, speed, winner_index):
+        """winner_index 세그먼트에서 멈추도록 초기 속도(도/초)를 보정"""
+        # 원래 속도로 돌렸을 때 멈추는 각도
+        natural_angle = self.angle + spin_distance(speed, spin_duration(speed))
+
+        # 당첨 세그먼트 안쪽 (경계에서 조금 떨어진 곳)에 화살표가 오도록 목표 지점 선택
+        start, end = self.segment_bounds(winner_index)
+        margin = (end - start) * 0.1
+        pointer_angle = self.rng.uniform(start + margin, end - margin)
+
+        # 원래 정지 각도 이후 처음으로 목표 지점이 화살표에 오는 각도
+        offset = (POINTER_ANGLE - pointer_angle - natural_angle) % 360
+        target_angle = natural_angle + offset
+
+        # 총 회전 각도 = (초기 속도 - 정지 속도) / 감속 계수
+        return (target_angle - self.angle) * SPIN_DECAY_RATE + SPIN_STOP_SPEED
+
+    def update(self, dt=None):
+        """룰렛 상태 업데이트
+
+        dt(초)를 주면 경과 시간으로 각도를 계산하고, 없으면 미리 계산한 궤적을
+        고정 시간 간격으로 한 스텝 재생함 (결정적인 리플레이용)
+        """
+        if not self.spinning:
+            return
+
+        if dt is None:
+            trajectory = self._ensure_trajectory()
+            self.angle = trajectory[self.spin_frame]
+            self.spin_frame += 1
+            self.spin_elapsed = self.spin_frame * SPIN_TIME_STEP
+            finished = self.spin_frame >= len(trajectory)
+        else:
+            self.spin_elapsed += dt
+            finished = self.spin_elapsed >= self.spin_duration
+            self.angle = self.spin_start_angle + spin_distance(
+                self.spin_initial_speed, min(self.spin_elapsed, self.spin_duration)
+            )
+
+        # 현재 속도 (점차 감속)
+        self.spin_speed = self.spin_initial_speed * math.exp(
+            -SPIN_DECAY_RATE * self.spin_elapsed
+        )
+
+        if finished:
+            self.angle = self.target_angle
+            self.spinning = False
+            self.select_player()
+
+    def skip_spin(self):
+        """애니메이션을 건너뛰고 바로 멈춘 상태로 이동"""
+        if self.spinning:
+            self.angle = self.target_angle
+            self.spin_speed = 0
+            self.spinning = False
+            self.select_player()
+
+    def set_players(self, players, weights=None):
+        """플레이어 목록과 가중치 설정 (목록을 복사해 두고 세그먼트 테이블을 다시 만듦)"""
+        self.players = list(players)
+        if weights is None:
+            weights = [1.0] * len(self.players)
+        self.weights = list(weights)
+        self._rebuild_segments()
+
+    def bind(self, registry):
+        """PlayerRegistry와 연결 (이후 변경 알림을 받아 바뀐 부분만 갱신)"""
+        if self._registry is not None:
+            self._registry.unsubscribe(self.on_players_changed)
+        self._registry = registry
+        self.set_players(registry.as_list(), registry.weight_list())
+        registry.subscribe(self.on_players_changed)
+
+    def on_players_changed(self, kind, names):
+        """연결된 PlayerRegistry의 변경 알림 처리"""
+        registry = self._registry
+        if kind == "add":
+            self.add_players(names, [registry.get_weight(name) for name in names])
+        elif kind == "remove":
+            self.remove_players(names)
+        elif kind == "weights":
+            for name in names:
+                self.set_weight(name, registry.get_weight(name))
+
+    def add_players(self, names, weights=None):
+        """목록 끝에 플레이어 추가 (기존 세그먼트 테이블은 그대로 두고 뒤에 이어 붙임)"""
+        if weights is None:
+            weights = [1.0] * len(names)
+        total = self._cumulative[-1] if self._cumulative else 0.0
+        for name, weight in zip(names, weights):
+            if name in self._positions:
+                continue
+            self._positions[name] = len(self.players)
+            self.players.append(name)
+            self.weights.append(weight)
+            total += weight
+            self._cumulative.append(total)
+        self._segments_changed()
+
+    def remove_players(self, names):
+        """플레이어 삭제 (삭제된 위치 뒤의 세그먼트만 다시 계산)"""
+        indexes = [self._positions[name] for name in names if name in self._positions]
+        if not indexes:
+            return
+        removed = set(names)
+        first = min(indexes)
+        tail = [
+            (name, weight)
+            for name, weight in zip(self.players[first:], self.weights[first:])
+            if name not in removed
+        ]
+        del self.players[first:]
+        del self.weights[first:]
+        del self._cumulative[first:]
+        for name in removed:
+            self._positions.pop(name, None)
+
+        total = self._cumulative[-1] if self._cumulative else 0.0
+        for name, weight in tail:
+            self._positions[name] = len(self.players)
+            self.players.append(name)
+            self.weights.append(weight)
+            total += weight
+            self._cumulative.append(total)
+        self._segments_changed()
+
+    def set_weight(self, name, weight):
+        """플레이어 한 명의 가중치 변경 (그 뒤 세그먼트의 누적 가중치만 갱신)"""
+        index = self._positions.get(name)
+        if index is None:
+            return
+        delta = weight - self.weights[index]
+        self.weights[index] = weight
+        for i in range(index, len(self._cumulative)):
+            self._cumulative[i] += delta
+        self._segments_changed()
+
+    def _rebuild_segments(self):
+        """플레이어 목록 전체로 세그먼트 테이블 다시 만들기"""
+        self._positions = {name: i for i, name in enumerate(self.players)}
+        self._cumulative = array("d")
+        total = 0.0
+        for weight in self.weights:
+            total += weight
+            self._cumulative.append(total)
+        self._segments_changed()
+
+    def _segments_changed(self):
+        self._roster_version += 1
+        self._alias_dirty = True
+        if self.spinning:
+            # 회전은 그대로 이어가고 멈출 위치의 플레이어만 다시 계산
+            self.target_player = self.player_at_angle(self.target_angle)
+
+    def is_weighted(self):
+        """플레이어별 가중치가 서로 다른지 확인"""
+        return len(set(self.weights)) > 1
+
+    def _ensure_alias_table(self):
+        """가중치가 바뀐 경우에만 별칭 테이블 재생성"""
+        if self._alias_dirty:
+            self._alias_table = AliasTable(self.weights) if self.is_weighted() else None
+            self._alias_dirty = False
+
+    def segment_bounds(self, index):
+        """index번 세그먼트의 시작/끝 각도 (룰렛 기준, 도 단위)"""
+        total = self._cumulative[-1]
+        start = 360 * self._cumulative[index - 1] / total if index > 0 else 0.0
+        # 부동소수점 오차로 마지막 경계가 어긋나지 않도록
+        if index == len(self._cumulative) - 1:
+            return start, 360.0
+        return start, 360 * self._cumulative[index] / total
+
+    def segment_at(self, wheel_angle):
+        """룰렛 기준 각도에 해당하는 세그먼트 인덱스 (O(log N))"""
+        if not self._cumulative:
+            return None
+        # 각도를 누적 가중치 단위로 바꿔 이진 탐색
+        position = (wheel_angle % 360) * self._cumulative[-1] / 360
+        index = bisect_right(self._cumulative, position)
+        return min(index, len(self._cumulative) - 1)
+
+    def pointer_segment(self, angle=None):
+        """룰렛이 angle만큼 회전했을 때 화살표가 가리키는 세그먼트 인덱스"""
+        if angle is None:
+            angle = self.angle
+        # 화살표 위치를 룰렛 기준 각도로 변환
+        return self.segment_at(POINTER_ANGLE - angle)
+
+    def player_at_angle(self, angle):
+        """룰렛이 angle만큼 회전했을 때 화살표가 가리키는 플레이어"""
+        if not self.players:
+            return None
+        return self.players[self.pointer_segment(angle)]
+
+    def select_player(self):
+        """룰렛이 멈추면 플레이어 선택"""
+        if not self.players:
+            return None
+
+        self.selected_player = self.player_at_angle(self.angle)
+        return self.selected_player
@@ -0,0 +1,43 @@
+import random
+
+
+class AliasTable:
+    """가중치 비례 샘플링을 O(1)에 수행하는 별칭 테이블 (Vose 방식)"""
+
+    def __init__(self, weights):
+        count = len(weights)
+        total = sum(weights)
+        if count == 0 or total <= 0:
+            raise ValueError("가중치는 하나 이상이어야 하고 합이 0보다 커야 합니다")
+
+        self.size = count
+        self.prob = [0.0] * count
+        self.alias = [0] * count
+
+        # 평균이 1이 되도록 정규화한 뒤 1보다 작은 칸과 큰 칸으로 나눔
+        scaled = [weight * count / total for weight in weights]
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            # 큰 칸에서 모자란 만큼을 떼어 작은 칸을 채움
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # 남은 칸은 부동소수점 오차를 무시하고 확률 1로 처리
+        for index in large + small:
+            self.prob[index] = 1.0
+
+    def sample(self, rng=random):
+        """가중치에 비례하는 인덱스 하나를 뽑음"""
+        index = rng.randrange(self.size)
+        if rng.random() < self.prob[index]:
+            return index
+        return self.alias[index]
@@ -0,0 +1,285 @@
+"""룰렛 공정성 시뮬레이터
+
+게임과 같은 회전 규칙(초기 속도 uniform(10, 20), 프레임당 0.98 감속, 0.1 미만에서
+정지, 화살표 위치로 당첨자 결정)으로 룰렛을 여러 번 돌려 플레이어별 당첨 횟수를 세고
+카이제곱 검정으로 기대 비율과 맞는지 확인합니다. NumPy가 있으면 벡터 연산으로
+수백만 번을 한 번에 계산하고, 없으면 RouletteModel을 그대로 반복 실행합니다.
+
+    python -m game.simulate --players 6 --spins 1000000
+    python -m game.simulate --data data/players.json --seed 1
+"""
+
+import argparse
+import math
+import random
+import time
+
+from game.roulette_model import (
+    POINTER_ANGLE,
+    REFERENCE_FPS,
+    SPIN_DECAY_RATE,
+    SPIN_STOP_SPEED,
+    RouletteModel,
+)
+from game.sampling import AliasTable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 순수 파이썬으로 계산
+    np = None
+
+BATCH_SIZE = 1000000  # NumPy로 한 번에 계산할 회전 수 (메모리 사용량 제한)
+
+
+class FairnessReport:
+    """플레이어별 당첨 횟수와 카이제곱 검정 결과"""
+
+    def __init__(self, players, weights, counts, elapsed, backend):
+        self.players = list(players)
+        self.counts = list(counts)
+        self.spins = sum(self.counts)
+        self.elapsed = elapsed
+        self.backend = backend
+
+        total_weight = sum(weights)
+        self.expected = [self.spins * w / total_weight for w in weights]
+        self.chi_square = sum(
+            (observed - expected) ** 2 / expected
+            for observed, expected in zip(self.counts, self.expected)
+        )
+        self.dof = len(self.players) - 1
+        self.p_value = chi_square_p_value(self.chi_square, self.dof)
+
+    def spins_per_second(self):
+        return self.spins / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def format(self):
+        """결과를 표 형태의 문자열로 변환"""
+        lines = [f"{'플레이어':<16} {'당첨':>10} {'기대값':>12} {'비율':>8}"]
+        for player, observed, expected in zip(self.players, self.counts, self.expected):
+            lines.append(
+                f"{player:<16} {observed:>10} {expected:>12.1f}"
+                f" {observed / expected:>8.4f}"
+            )
+        lines.append(
+            f"카이제곱 = {self.chi_square:.3f} (자유도 {self.dof}),"
+            f" p = {self.p_value:.4f}"
+        )
+        lines.append(
+            f"{self.spins}회 / {self.elapsed:.2f}초"
+            f" ({self.spins_per_second():,.0f}회/초, {self.backend})"
+        )
+        return "\n".join(lines)
+
+
+def chi_square_p_value(statistic, dof):
+    """카이제곱 분포의 위쪽 꼬리 확률 P(X >= statistic)"""
+    if dof <= 0:
+        return 1.0
+    return _upper_gamma(dof / 2, statistic / 2)
+
+
+def _upper_gamma(a, x, iterations=200, epsilon=1e-12):
+    """정규화된 위쪽 불완전 감마 함수 Q(a, x)"""
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        # 급수 전개로 P(a, x)를 구한 뒤 1에서 뺌
+        term = total = 1 / a
+        denominator = a
+        for _ in range(iterations):
+            denominator += 1
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * epsilon:
+                break
+        return max(0.0, 1 - total * math.exp(log_prefix))
+
+    # 연분수 전개 (Lentz 방법)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, iterations + 1):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < epsilon:
+            break
+    return math.exp(log_prefix) * h
+
+
+def _boundaries(weights):
+    """세그먼트별 끝 각도 누적 테이블 (RouletteModel과 같은 방식)"""
+    total = sum(weights)
+    boundaries = []
+    cumulative = 0.0
+    for weight in weights:
+        cumulative += weight
+        boundaries.append(360 * cumulative / total)
+    boundaries[-1] = 360.0
+    return boundaries
+
+
+def _stop_distance(speed):
+    """초기 속도(도/초) 배열별로 정지할 때까지 회전하는 각도
+
+    RouletteModel과 같은 닫힌 식 spin_distance(v, spin_duration(v))를 벡터로 계산
+    """
+    duration = np.log(np.maximum(speed, SPIN_STOP_SPEED) / SPIN_STOP_SPEED)
+    duration /= SPIN_DECAY_RATE
+    return speed * (1 - np.exp(-SPIN_DECAY_RATE * duration)) / SPIN_DECAY_RATE
+
+
+def _simulate_numpy(weights, spins, seed, chained):
+    """회전 결과를 NumPy 배열로 한 번에 계산해 세그먼트별 당첨 횟수 반환
+
+    가중치가 있으면 RouletteModel._steer_speed처럼 별칭 테이블로 당첨자를 먼저 뽑고
+    그 세그먼트에 멈추도록 속도를 보정하는데, 닫힌 식으로 계산한 보정 결과는 항상
+    목표 각도와 같습니다. 따라서 이 경로의 결과는 별칭 테이블 추출과 세그먼트 경계
+    판정만 확인하며, 프레임 단위 회전까지 포함한 확인은 python 백엔드로 합니다.
+    """
+    rng = np.random.default_rng(seed)
+    boundaries = np.array(_boundaries(weights))
+    weighted = len(set(weights)) > 1
+    if weighted:
+        table = AliasTable(weights)
+        prob = np.array(table.prob)
+        alias = np.array(table.alias)
+        starts = np.concatenate(([0.0], boundaries[:-1]))
+
+    counts = np.zeros(len(weights), dtype=np.int64)
+    angle = 0.0
+    remaining = spins
+    while remaining > 0:
+        size = min(BATCH_SIZE, remaining)
+        remaining -= size
+
+        speed = rng.uniform(10, 20, size) * REFERENCE_FPS
+        if weighted:
+            # RouletteModel._steer_speed와 같은 방식으로 초기 속도를 보정한 뒤
+            # 보정된 속도로 정지 각도를 계산 (당첨자는 정지 각도로만 판정)
+            index = rng.integers(0, len(weights), size)
+            winner = np.where(rng.random(size) < prob[index], index, alias[index])
+            margin = (boundaries[winner] - starts[winner]) * 0.1
+            pointer = rng.uniform(starts[winner] + margin, boundaries[winner] - margin)
+
+            # 각 회전의 시작 각도 (보정된 회전은 목표 지점에서 멈추므로, 이어서 돌릴
+            # 때 다음 회전은 이전 회전의 목표 정지 각도에서 시작)
+            if chained:
+                start_angle = np.empty(size)
+                start_angle[0] = angle
+                start_angle[1:] = (POINTER_ANGLE - pointer[:-1]) % 360
+            else:
+                start_angle = np.zeros(size)
+
+            natural = start_angle + _stop_distance(speed)
+            target = natural + (POINTER_ANGLE - pointer - natural) % 360
+            speed = (target - start_angle) * SPIN_DECAY_RATE + SPIN_STOP_SPEED
+            final = start_angle + _stop_distance(speed)
+            angle = float(final[-1] % 360)
+        else:
+            distance = _stop_distance(speed)
+            if chained:
+                # 게임처럼 이전에 멈춘 각도에서 다음 회전을 시작
+                final = angle + np.cumsum(distance)
+                angle = float(final[-1] % 360)
+            else:
+                final = distance
+
+        # 화살표 위치를 룰렛 기준 각도로 바꿔 세그먼트 찾기
+        wheel_angle = (POINTER_ANGLE - final) % 360
+        segments = np.searchsorted(boundaries, wheel_angle, side="right")
+        segments = np.minimum(segments, len(weights) - 1)
+        counts += np.bincount(segments, minlength=len(weights))
+    return counts.tolist()
+
+
+def _simulate_python(players, weights, spins, seed, chained):
+    # 게임에서 쓰는 RouletteModel을 그대로 실행 (애니메이션 궤적은 계산하지 않음)
+    # 이름 대신 번호로 집계
+    model = RouletteModel(range(len(players)), weights, random.Random(seed))
+    counts = [0] * len(players)
+    for _ in range(spins):
+        if not chained:
+            model.angle = 0
+        model.start_spin(fast=True)
+        counts[model.selected_player] += 1
+    return counts
+
+
+def simulate(players, spins, weights=None, seed=None, chained=True, backend=None):
+    """룰렛을 spins번 돌려 플레이어별 당첨 결과 보고서 반환
+
+    chained가 True이면 게임처럼 이전 라운드에서 멈춘 각도에서 다음 회전을 시작하고,
+    False이면 매번 처음(각도 0)에서 시작합니다 (게임을 켜고 첫 라운드만 하는 경우).
+    backend는 "numpy" 또는 "python" (None이면 NumPy가 있을 때 numpy).
+    """
+    players = list(players)
+    if len(players) < 2:
+        raise ValueError("플레이어가 2명 이상이어야 합니다")
+    if weights is None:
+        weights = [1.0] * len(players)
+    if backend is None:
+        backend = "numpy" if np is not None else "python"
+    if backend == "numpy" and np is None:
+        raise ValueError("numpy 백엔드를 사용하려면 NumPy를 설치해야 합니다")
+
+    start = time.perf_counter()
+    if backend == "numpy":
+        counts = _simulate_numpy(weights, spins, seed, chained)
+    else:
+        counts = _simulate_python(players, weights, spins, seed, chained)
+    elapsed = time.perf_counter() - start
+    return FairnessReport(players, weights, counts, elapsed, backend)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="룰렛 공정성 시뮬레이터")
+    parser.add_argument("--players", type=int, default=6, help="플레이어 수")
+    parser.add_argument(
+        "--data", metavar="PATH", help="플레이어 데이터 파일 (이름과 가중치 사용)"
+    )
+    parser.add_argument("--spins", type=int, default=1000000, help="회전 횟수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    parser.add_argument(
+        "--independent",
+        action="store_true",
+        help="매번 각도 0에서 회전 시작 (기본은 이전 정지 각도에서 이어서 회전)",
+    )
+    parser.add_argument("--backend", choices=("numpy", "python"), default=None)
+    args = parser.parse_args(argv)
+
+    if args.data:
+        from game.storage import open_store
+
+        store = open_store(args.data)
+        names, custom_weights = store.load()
+        store.close()
+        players = names
+        weights = [custom_weights.get(name, 1.0) for name in names]
+    else:
+        players = [f"플레이어{i + 1}" for i in range(args.players)]
+        weights = None
+
+    report = simulate(
+        players,
+        args.spins,
+        weights,
+        seed=args.seed,
+        chained=not args.independent,
+        backend=args.backend,
+    )
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# 이 환경 변수가 설정되어 있으면 시작 단계별 소요 시간을 출력
+PROFILE_ENV = "BOOZEKING_PROFILE_STARTUP"
+
+
+class StartupProfiler:
+    """게임 시작 단계별 소요 시간 기록 (python -X importtime과 비슷한 형식으로 출력)
+
+    phase()는 중첩해서 사용할 수 있고 스레드마다 따로 들여쓰기 됩니다.
+    """
+
+    def __init__(self, enabled=True, time_source=time.perf_counter):
+        self.enabled = enabled
+        self._time_source = time_source
+        self.start = time_source()
+        self.records = []  # (스레드 이름, 깊이, 이름, 자체 시간, 누적 시간)
+        self.marks = {}  # 이름 -> 시작 후 경과 시간 (초)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def from_env(cls):
+        """환경 변수로 켜고 끄는 프로파일러 생성"""
+        return cls(enabled=bool(os.environ.get(PROFILE_ENV)))
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록 하나를 시작 단계 하나로 기록"""
+        if not self.enabled:
+            yield
+            return
+
+        stack = self._stack()
+        with self._lock:
+            order = len(self.records)
+            self.records.append(None)  # 시작 순서대로 출력되도록 자리만 잡아 둠
+        # 하위 단계들의 누적 시간을 모으는 칸
+        stack.append([0.0])
+        started = self._time_source()
+        try:
+            yield
+        finally:
+            cumulative = self._time_source() - started
+            children = stack.pop()[0]
+            if stack:
+                stack[-1][0] += cumulative
+            record = (
+                threading.current_thread().name,
+                len(stack),
+                name,
+                cumulative - children,
+                cumulative,
+            )
+            with self._lock:
+                self.records[order] = record
+
+    def mark(self, name):
+        """시작 후 name 시점까지 걸린 시간 기록 (예: 첫 프레임 표시)"""
+        if self.enabled:
+            self.marks[name] = self._time_source() - self.start
+
+    def elapsed(self, name):
+        """mark()로 기록한 시점 (초, 없으면 None)"""
+        return self.marks.get(name)
+
+    def report(self, file=None):
+        """단계별 소요 시간 출력"""
+        if not self.enabled:
+            return
+        file = file or sys.stderr
+        print("startup: self [us] | cumulative | phase", file=file)
+        with self._lock:
+            records = [record for record in self.records if record is not None]
+        # 메인 스레드 단계를 먼저, 스레드별로는 시작 순서대로 출력
+        records.sort(key=lambda record: record[0] != "MainThread")
+        for thread_name, depth, name, own, cumulative in records:
+            label = name if thread_name == "MainThread" else f"{name} [{thread_name}]"
+            print(
+                f"startup: {own * 1e6:>9.0f} | {cumulative * 1e6:>10.0f} |"
+                f" {'  ' * depth}{label}",
+                file=file,
+            )
+        for name, elapsed in self.marks.items():
+            print(f"startup: {name} at {elapsed * 1000:.1f} ms", file=file)
+
+
+class BackgroundTask:
+    """함수 하나를 백그라운드 스레드에서 실행하고 결과(또는 예외)를 보관"""
+
+    def __init__(self, target, name="background-task"):
+        self._target = target
+        self._result = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            self._result = self._target()
+        except BaseException as e:
+            self._error = e
+
+    def done(self):
+        """작업이 끝났는지 확인 (기다리지 않음)"""
+        return not self._thread.is_alive()
+
+    def result(self):
+        """작업이 끝날 때까지 기다린 뒤 결과 반환 (작업 중 예외가 나면 다시 발생)"""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
@@ -0,0 +1,119 @@
+import heapq
+import time
+from array import array
+
+
+class RoundStats:
+    """라운드 결과 통계
+
+    최근 capacity개 라운드는 고정 크기 링 버퍼(array)에 보관하고, 지목 횟수, 시간 초과
+    비율, 응답 시간 평균/백분위 같은 누적 통계는 라운드마다 O(1)로 갱신합니다.
+    """
+
+    def __init__(self, capacity=1024, max_response_time=10.0, bucket_size=0.1):
+        self.capacity = capacity
+
+        # 최근 라운드 링 버퍼
+        self._player_ids = array("I", [0]) * capacity
+        self._answered = array("B", [0]) * capacity
+        self._response_times = array("f", [0.0]) * capacity
+        self._played_at = array("d", [0.0]) * capacity
+        self._next = 0  # 다음에 기록할 위치
+        self._stored = 0  # 링 버퍼에 들어 있는 라운드 수
+
+        # 플레이어 이름 <-> 번호 (링 버퍼에는 번호만 저장)
+        self._names = []
+        self._ids = {}
+
+        # 누적 통계
+        self.total_rounds = 0
+        self.timeouts = 0
+        self.picks = {}  # 플레이어별 지목 횟수
+        self._answered_count = 0
+        self._response_sum = 0.0
+
+        # 응답 시간 히스토그램 (백분위 계산용, bucket_size초 단위)
+        self.bucket_size = bucket_size
+        bucket_count = int(max_response_time / bucket_size) + 1
+        self._histogram = array("I", [0]) * bucket_count
+
+    def _player_id(self, name):
+        player_id = self._ids.get(name)
+        if player_id is None:
+            player_id = len(self._names)
+            self._names.append(name)
+            self._ids[name] = player_id
+        return player_id
+
+    def record(self, player, answered, response_time, played_at=None):
+        """라운드 결과 하나를 기록"""
+        if played_at is None:
+            played_at = time.time()
+
+        slot = self._next
+        self._player_ids[slot] = self._player_id(player)
+        self._answered[slot] = 1 if answered else 0
+        self._response_times[slot] = response_time
+        self._played_at[slot] = played_at
+        self._next = (slot + 1) % self.capacity
+        self._stored = min(self._stored + 1, self.capacity)
+
+        self.total_rounds += 1
+        self.picks[player] = self.picks.get(player, 0) + 1
+        if answered:
+            self._answered_count += 1
+            self._response_sum += response_time
+            bucket = min(
+                int(response_time / self.bucket_size), len(self._histogram) - 1
+            )
+            self._histogram[bucket] += 1
+        else:
+            self.timeouts += 1
+
+    def timeout_rate(self):
+        """시간 초과 비율 (0.0 ~ 1.0)"""
+        if not self.total_rounds:
+            return 0.0
+        return self.timeouts / self.total_rounds
+
+    def mean_response_time(self):
+        """시간 안에 대답한 라운드의 평균 응답 시간 (초)"""
+        if not self._answered_count:
+            return 0.0
+        return self._response_sum / self._answered_count
+
+    def response_time_percentile(self, percent):
+        """시간 안에 대답한 라운드의 응답 시간 백분위 (bucket_size 단위 근사값)"""
+        if not self._answered_count:
+            return 0.0
+        target = self._answered_count * percent / 100
+        seen = 0
+        for bucket, count in enumerate(self._histogram):
+            seen += count
+            if count and seen >= target:
+                return round((bucket + 1) * self.bucket_size, 6)
+        return len(self._histogram) * self.bucket_size
+
+    def leaderboard(self, limit=5):
+        """가장 많이 지목된 플레이어 순위 [(이름, 횟수), ...]"""
+        return heapq.nlargest(limit, self.picks.items(), key=lambda item: item[1])
+
+    def recent(self, limit=None):
+        """최근 라운드 결과 (최신순) [(플레이어, 대답 여부, 응답 시간, 시각), ...]"""
+        count = self._stored if limit is None else min(limit, self._stored)
+        rounds = []
+        for offset in range(1, count + 1):
+            slot = (self._next - offset) % self.capacity
+            rounds.append(
+                (
+                    self._names[self._player_ids[slot]],
+                    bool(self._answered[slot]),
+                    self._response_times[slot],
+                    self._played_at[slot],
+                )
+            )
+        return rounds
+
+    def __len__(self):
+        """링 버퍼에 보관 중인 라운드 수"""
+        return self._stored
@@ -0,0 +1,385 @@
+import json
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+import time
+
+# 이 확장자로 끝나는 데이터 경로는 SQLite 저장소 사용
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+# 새로 만드는 데이터 파일의 권한 (umask는 읽으려면 프로세스 전체 값을 바꿔야 하므로
+# 쓰지 않음)
+NEW_FILE_MODE = 0o644
+
+
+def _file_mode(path):
+    """path를 교체할 때 유지할 권한 (없는 파일이면 NEW_FILE_MODE)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except OSError:
+        return NEW_FILE_MODE
+
+
+def atomic_write_json(path, data):
+    """임시 파일에 쓴 뒤 교체하여 중간에 죽어도 기존 파일이 깨지지 않도록 저장"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp는 0600으로 만들므로 기존 파일(또는 새 파일 기본값)의 권한으로 맞춤
+        os.chmod(temp_path, _file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    # 파일 이름 교체까지 디스크에 반영 (디렉토리 fsync를 지원하지 않는 OS는 무시)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class WriteBehindWriter:
+    """연속된 저장 요청을 모아 백그라운드 스레드에서 한 번에 저장"""
+
+    def __init__(self, path, delay=0.5, max_delay=2.0):
+        self.path = path
+        self.delay = delay  # 마지막 요청 후 이만큼 조용하면 저장
+        self.max_delay = max_delay  # 요청이 계속 들어와도 이 시간 안에는 저장
+        self._condition = threading.Condition()
+        self._pending = None
+        self._has_pending = False
+        self._first_request = 0.0
+        self._last_request = 0.0
+        self._flush_requested = False
+        self._writing = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def schedule(self, data):
+        """저장할 데이터 스냅샷 등록 (바로 반환, 이전에 밀린 요청은 덮어씀)"""
+        with self._condition:
+            now = time.monotonic()
+            if not self._has_pending:
+                self._first_request = now
+            self._pending = data
+            self._has_pending = True
+            self._last_request = now
+            self._condition.notify_all()
+
+    def flush(self, timeout=5.0):
+        """밀린 저장 요청을 즉시 기록하고 끝날 때까지 대기"""
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: not self._has_pending and not self._writing, timeout
+            )
+            self._flush_requested = False
+
+    def close(self, timeout=5.0):
+        """남은 요청을 저장하고 스레드 종료"""
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _ready_delay(self):
+        """지금 저장해도 되면 0, 아니면 더 기다릴 시간 (초)"""
+        if self._flush_requested or self._closed:
+            return 0
+        now = time.monotonic()
+        quiet_until = self._last_request + self.delay
+        deadline = self._first_request + self.max_delay
+        return max(0, min(quiet_until, deadline) - now)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._has_pending and not self._closed:
+                    self._condition.wait()
+                if not self._has_pending:
+                    return
+
+                # 요청이 잠잠해질 때까지 기다리며 여러 번의 수정을 한 번으로 합침
+                wait_time = self._ready_delay()
+                while wait_time > 0:
+                    self._condition.wait(wait_time)
+                    wait_time = self._ready_delay()
+
+                data = self._pending
+                self._pending = None
+                self._has_pending = False
+                self._writing = True
+
+            try:
+                atomic_write_json(self.path, data)
+            except Exception as e:
+                print(f"데이터 저장 실패: {e}")
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+
+class JsonStore:
+    """플레이어 목록을 JSON 파일 하나에 통째로 저장하는 저장소 (라운드 기록 없음)"""
+
+    def __init__(self, path, save_delay=0.5):
+        self.path = path
+        # 저장은 백그라운드 스레드에서 모아서 처리 (이벤트 처리 중 디스크 대기 없음)
+        self.writer = WriteBehindWriter(path, delay=save_delay)
+
+    def load(self):
+        """저장된 (이름 목록, 가중치 딕셔너리) 반환"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, list):
+                    # 이전 형식: 플레이어 이름 목록만 저장됨
+                    return data, {}
+                return data.get("players", []), data.get("weights", {})
+        except Exception as e:
+            print(f"플레이어 데이터 로드 실패: {e}")
+            # 깨진 파일은 다음 저장 때 덮어쓰지 않도록 따로 보관
+            if os.path.exists(self.path):
+                backup_path = self.path + ".corrupt"
+                try:
+                    os.replace(self.path, backup_path)
+                    print(f"손상된 데이터 파일을 {backup_path}에 보관했습니다")
+                except OSError as e:
+                    print(f"손상된 데이터 파일 보관 실패: {e}")
+        return [], {}
+
+    def save_players(self, registry):
+        """플레이어 데이터 저장 예약 (현재 상태의 복사본을 백그라운드에서 기록)"""
+        self.writer.schedule(
+            {
+                "players": list(registry.as_list()),
+                "weights": registry.custom_weights(),
+            }
+        )
+
+    def players_changed(self, registry, kind, names):
+        """플레이어 변경 반영 (JSON 파일은 전체를 다시 씀)"""
+        self.save_players(registry)
+
+    def record_round(self, player, question, answered, response_time):
+        """라운드 결과 기록 (JSON 저장소는 기록하지 않음)"""
+
+    def recent_rounds(self, limit=100):
+        """최근 라운드 결과 (JSON 저장소는 기록이 없음)"""
+        return []
+
+    def flush(self):
+        """예약된 저장을 즉시 디스크에 기록"""
+        self.writer.flush()
+
+    def close(self):
+        """남은 데이터를 저장하고 저장 스레드 정리"""
+        self.writer.close()
+
+
+class SqliteStore:
+    """플레이어와 라운드 기록을 SQLite(WAL 모드)에 저장하는 저장소
+
+    변경 사항은 한 줄씩 증분 저장하며, 쓰기는 전용 스레드에서 모아서
+    트랜잭션 하나로 처리합니다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS players (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            weight REAL NOT NULL DEFAULT 1.0
+        );
+        CREATE TABLE IF NOT EXISTS rounds (
+            id INTEGER PRIMARY KEY,
+            played_at REAL NOT NULL,
+            player TEXT NOT NULL,
+            question TEXT,
+            answered INTEGER NOT NULL,
+            response_time REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_rounds_player ON rounds (player);
+        CREATE INDEX IF NOT EXISTS idx_rounds_played_at ON rounds (played_at);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # 읽기 전용으로 쓰는 메인 스레드 연결 (WAL 모드라 쓰기와 동시에 읽을 수 있음)
+        self.connection = self._connect()
+        self.connection.executescript(self.SCHEMA)
+        self.connection.commit()
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="sqlite-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _connect(self):
+        # 메인 연결은 로드 스레드에서 만들어 메인 스레드에서 쓸 수 있으므로 스레드 검사 해제
+        # (한 번에 한 스레드만 사용)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def load(self):
+        """저장된 (이름 목록, 가중치 딕셔너리) 반환"""
+        try:
+            rows = self.connection.execute(
+                "SELECT name, weight FROM players ORDER BY id"
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"플레이어 데이터 로드 실패: {e}")
+            return [], {}
+        names = [name for name, _ in rows]
+        weights = {name: weight for name, weight in rows if weight != 1.0}
+        return names, weights
+
+    def _execute(self, sql, rows):
+        """쓰기 스레드에 SQL 실행 예약 (rows는 파라미터 목록)"""
+        self._queue.put((sql, rows))
+
+    def save_players(self, registry):
+        """플레이어 목록 전체를 현재 상태로 교체"""
+        self._execute("DELETE FROM players", [()])
+        self._execute(
+            "INSERT INTO players (name, weight) VALUES (?, ?)",
+            [(name, registry.get_weight(name)) for name in registry.as_list()],
+        )
+
+    def players_changed(self, registry, kind, names):
+        """변경된 플레이어만 증분 저장"""
+        if kind == "add":
+            self._execute(
+                "INSERT OR IGNORE INTO players (name, weight) VALUES (?, ?)",
+                [(name, registry.get_weight(name)) for name in names],
+            )
+        elif kind == "remove":
+            self._execute(
+                "DELETE FROM players WHERE name = ?", [(name,) for name in names]
+            )
+        elif kind == "weights":
+            self._execute(
+                "UPDATE players SET weight = ? WHERE name = ?",
+                [(registry.get_weight(name), name) for name in names],
+            )
+
+    def record_round(self, player, question, answered, response_time):
+        """라운드 결과 기록"""
+        self._execute(
+            "INSERT INTO rounds (played_at, player, question, answered, response_time)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [(time.time(), player, question, int(answered), response_time)],
+        )
+
+    def recent_rounds(self, limit=100):
+        """최근 라운드 결과 (최신순)"""
+        return self.connection.execute(
+            "SELECT played_at, player, question, answered, response_time"
+            " FROM rounds ORDER BY played_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def player_rounds(self, player, since=0):
+        """특정 플레이어의 since(유닉스 시간) 이후 라운드 결과"""
+        return self.connection.execute(
+            "SELECT played_at, question, answered, response_time FROM rounds"
+            " WHERE player = ? AND played_at >= ? ORDER BY played_at",
+            (player, since),
+        ).fetchall()
+
+    def _run(self):
+        connection = self._connect()
+        while True:
+            task = self._queue.get()
+            # 쌓여 있는 작업을 모두 꺼내 트랜잭션 하나로 처리
+            tasks = [task]
+            while task is not None:
+                try:
+                    task = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                tasks.append(task)
+
+            try:
+                with connection:
+                    for item in tasks:
+                        if item is not None:
+                            connection.executemany(*item)
+            except sqlite3.Error as e:
+                print(f"데이터 저장 실패: {e}")
+            finally:
+                for _ in tasks:
+                    self._queue.task_done()
+
+            if tasks[-1] is None:
+                connection.close()
+                return
+
+    def flush(self):
+        """예약된 쓰기가 모두 끝날 때까지 대기"""
+        self._queue.join()
+
+    def close(self):
+        """남은 쓰기를 마치고 연결 종료"""
+        self._queue.put(None)
+        self._thread.join()
+        self.connection.close()
+
+
+class MemoryStore:
+    """아무것도 저장하지 않는 저장소 (헤드리스 시뮬레이션/테스트용)"""
+
+    def load(self):
+        return [], {}
+
+    def save_players(self, registry):
+        pass
+
+    def players_changed(self, registry, kind, names):
+        pass
+
+    def record_round(self, player, question, answered, response_time):
+        pass
+
+    def recent_rounds(self, limit=100):
+        return []
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def open_store(path, save_delay=0.5):
+    """데이터 경로의 확장자에 맞는 저장소 생성 (경로가 없으면 메모리 저장소)"""
+    if path is None:
+        return MemoryStore()
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        return SqliteStore(path)
+    return JsonStore(path, save_delay)
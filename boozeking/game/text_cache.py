@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+from game.glyph_atlas import GlyphAtlas
+
+
+class TextCache:
+    """렌더링된 텍스트 Surface를 재사용하기 위한 LRU 캐시"""
+
+    def __init__(self, max_size=256, use_atlas=True):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        # 캐시에 없는 문자열은 폰트별 글리프 아틀라스에서 조합 (글자마다 한 번만 래스터화)
+        self.use_atlas = use_atlas
+        self._atlases = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """캐시된 텍스트 Surface 반환 (없으면 렌더링 후 저장)"""
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if self.use_atlas and antialias:
+            surface = self.atlas(font).render(text, color)
+        else:
+            surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            # 가장 오래 사용되지 않은 항목 제거
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def atlas(self, font):
+        """폰트의 글리프 아틀라스 (없으면 생성)"""
+        atlas = self._atlases.get(font)
+        if atlas is None:
+            atlas = GlyphAtlas(font)
+            self._atlases[font] = atlas
+        return atlas
+
+    def clear(self):
+        """캐시 비우기 (폰트를 다시 로드할 때 호출)"""
+        self._surfaces.clear()
+        self._atlases.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
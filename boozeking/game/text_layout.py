@@ -0,0 +1,155 @@
+from collections import OrderedDict
+
+import pygame
+
+MIN_FONT_SIZE = 18  # 글자 크기를 줄일 때의 최소 크기
+FONT_SIZE_STEP = 2  # 상자에 맞출 때 한 번에 줄이는 글자 크기
+ELLIPSIS = "…"
+
+# 줄 첫머리에 오면 어색한 문장 부호 (앞 글자와 함께 다음 줄로 넘김)
+NO_LINE_START = set(".,!?:;)]}>~…'\"”’」』》〉、。")
+
+
+def is_breakable(char):
+    """글자 앞뒤에서 줄을 바꿀 수 있는 문자인지 (한글 음절, 한자, 가나)"""
+    code = ord(char)
+    return (
+        0xAC00 <= code <= 0xD7A3  # 한글 음절
+        or 0x1100 <= code <= 0x11FF  # 한글 자모
+        or 0x3130 <= code <= 0x318F  # 호환용 한글 자모
+        or 0x3040 <= code <= 0x30FF  # 히라가나, 가타카나
+        or 0x4E00 <= code <= 0x9FFF  # 한자
+    )
+
+
+def _fit_prefix(word, width, measure):
+    """width 안에 들어가는 word의 가장 긴 앞부분 길이 (최소 1글자)"""
+    low, high = 1, len(word)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if measure(word[:middle]) <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _break_point(word, cut):
+    """word[:cut] 이내에서 줄을 바꾸기 좋은 위치 (없으면 cut 그대로)"""
+    for i in range(cut, 0, -1):
+        if i < len(word) and word[i] in NO_LINE_START:
+            continue
+        # 한글/한자 사이나 하이픈 뒤에서 끊음 (영문 단어 중간은 피함)
+        if is_breakable(word[i - 1]) or word[i - 1] == "-":
+            return i
+        if i < len(word) and is_breakable(word[i]):
+            return i
+    return cut
+
+
+def break_lines(text, width, measure):
+    """text를 폭 width 안에 들어가도록 여러 줄로 나눈 목록
+
+    단어(띄어쓰기) 단위로 채우고, 한 단어가 한 줄보다 길 때만 단어 안에서 나눕니다.
+    한글은 음절 사이 어디서나 나눌 수 있지만 문장 부호가 줄 첫머리에 오지 않도록
+    합니다. measure(문자열)는 문자열의 폭(px)을 반환하는 함수입니다.
+    """
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}" if line else word
+            if measure(candidate) <= width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            # 단어 하나가 한 줄보다 길면 단어 안에서 나눔
+            while len(word) > 1 and measure(word) > width:
+                cut = _break_point(word, _fit_prefix(word, width, measure))
+                lines.append(word[:cut])
+                word = word[cut:]
+            line = word
+        lines.append(line)
+    return lines
+
+
+def _truncate(line, width, measure):
+    """line 끝을 잘라 말줄임표를 붙여 width 안에 맞춤"""
+    while line and measure(line + ELLIPSIS) > width:
+        line = line[:-1]
+    return line.rstrip() + ELLIPSIS
+
+
+class TextLayout:
+    """여러 줄 텍스트를 상자 폭에 맞게 배치하고 한 장의 Surface로 합쳐 캐시
+
+    같은 질문을 여러 화면에서 매 프레임 그리므로, (텍스트, 글자 크기, 색, 상자 크기)
+    별로 줄 나누기와 합성은 한 번만 합니다.
+    """
+
+    def __init__(
+        self, fonts, text_cache=None, max_size=64, min_font_size=MIN_FONT_SIZE
+    ):
+        self.fonts = fonts  # 크기별 폰트를 제공하는 FontLibrary
+        self.text_cache = text_cache
+        self.max_size = max_size
+        self.min_font_size = min_font_size
+        self._surfaces = OrderedDict()
+
+    def layout(self, text, size, width, height=None):
+        """상자에 맞는 (폰트, 줄 목록) (높이를 넘으면 글자 크기를 줄여 봄)"""
+        while True:
+            font = self.fonts.get(size)
+            lines = break_lines(text, width, lambda s: font.size(s)[0])
+            if height is None or len(lines) * font.get_linesize() <= height:
+                return font, lines
+            if size - FONT_SIZE_STEP < self.min_font_size:
+                break
+            size -= FONT_SIZE_STEP
+
+        # 가장 작은 글자로도 넘치면 들어가는 줄까지만 표시
+        max_lines = max(1, height // font.get_linesize())
+        if len(lines) > max_lines:
+            lines = lines[:max_lines]
+            lines[-1] = _truncate(lines[-1], width, lambda s: font.size(s)[0])
+        return font, lines
+
+    def render(self, text, size, color, width, height=None):
+        """text를 폭 width(높이 height) 상자에 맞춰 가운데 정렬한 Surface"""
+        key = (text, size, tuple(color), width, height)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        font, lines = self.layout(text, size, width, height)
+        line_surfaces = [self._render_line(font, line, color) for line in lines]
+        line_height = font.get_linesize()
+        surface = pygame.Surface(
+            (
+                max((line.get_width() for line in line_surfaces), default=0),
+                line_height * len(line_surfaces),
+            ),
+            pygame.SRCALPHA,
+        )
+        for i, line_surface in enumerate(line_surfaces):
+            line_rect = line_surface.get_rect(
+                midtop=(surface.get_width() // 2, i * line_height)
+            )
+            # 투명한 Surface 위에 합성할 때 가장자리가 어두워지지 않도록 최대값으로 합성
+            surface.blit(line_surface, line_rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def _render_line(self, font, line, color):
+        if self.text_cache is not None:
+            return self.text_cache.render(font, line, color)
+        return font.render(line, True, color)
+
+    def clear(self):
+        """캐시 비우기"""
+        self._surfaces.clear()
@@ -0,0 +1,103 @@
+import heapq
+import itertools
+import time
+
+
+class Timer:
+    """TimerService.schedule()로 예약한 콜백 하나"""
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline  # 만료 시각 (TimerService 시계 기준, 초)
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.fired = False
+
+    @property
+    def pending(self):
+        """아직 실행되지도 취소되지도 않았는지 여부"""
+        return not (self.cancelled or self.fired)
+
+
+class TimerService:
+    """만료 시각 순서대로 콜백을 실행하는 타이머 모음 (힙 사용)
+
+    시간은 단조 증가 시계(기본은 게임 시계)로 재고, 만료된 타이머는 run_due()에서
+    한 번만 실행됩니다. 다음 만료 시각이 바뀔 수 있을 때마다 subscribe()로 등록한
+    콜백에 남은 시간(초, 예약이 없으면 None)을 알려 주므로, 화면 쪽에서는 매
+    프레임 확인하는 대신 그 시각에 맞춰 깨어나기만 하면 됩니다.
+    """
+
+    def __init__(self, time_source=time.perf_counter):
+        self.time_source = time_source
+        self._heap = []  # (만료 시각, 예약 순서, Timer)
+        self._order = itertools.count()  # 만료 시각이 같으면 예약한 순서대로 실행
+        self._pending = 0
+        self._listeners = []
+
+    def __len__(self):
+        return self._pending
+
+    def subscribe(self, callback):
+        """다음 만료까지 남은 시간 변경 알림 등록 (callback(초 또는 None))"""
+        self._listeners.append(callback)
+
+    def _notify(self):
+        delay = self.time_until_next()
+        for callback in list(self._listeners):
+            callback(delay)
+
+    def schedule(self, delay, callback, *args):
+        """delay초 뒤에 callback(*args)를 실행하도록 예약하고 Timer 반환"""
+        timer = Timer(self.time_source() + delay, callback, args)
+        heapq.heappush(self._heap, (timer.deadline, next(self._order), timer))
+        self._pending += 1
+        self._notify()
+        return timer
+
+    def cancel(self, timer):
+        """예약 취소 (힙에서는 만료 시각이 될 때 버림)"""
+        if timer is None or not timer.pending:
+            return False
+        timer.cancelled = True
+        self._pending -= 1
+        self._notify()
+        return True
+
+    def next_deadline(self):
+        """가장 먼저 만료될 타이머의 만료 시각 (없으면 None)"""
+        heap = self._heap
+        while heap and not heap[0][2].pending:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def time_until_next(self):
+        """가장 먼저 만료될 타이머까지 남은 시간 (초, 없으면 None)"""
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - self.time_source())
+
+    def run_due(self):
+        """만료된 타이머를 만료 순서대로 실행하고 실행한 개수 반환"""
+        now = self.time_source()
+        fired = 0
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if not timer.pending:
+                continue
+            timer.fired = True
+            self._pending -= 1
+            fired += 1
+            timer.callback(*timer.args)
+        self._notify()
+        return fired
+
+    def clear(self):
+        """모든 예약 취소"""
+        for _, _, timer in self._heap:
+            timer.cancelled = True
+        self._heap = []
+        self._pending = 0
+        self._notify()
@@ -1,62 +1,46 @@
 import pygame
-import os
+
+from game.fonts import FontLibrary
+from game.text_cache import TextCache
+from game.text_layout import TextLayout
+
+# 폰트 크기
+FONT_SIZE_LARGE = 48
+FONT_SIZE_MEDIUM = 36
+FONT_SIZE_SMALL = 24
 
 
 class UI:
     def __init__(self, screen):
         self.screen = screen
 
-        # 폰트 파일 경로 설정 (game/fonts 디렉토리 안에 폰트 파일이 있다고 가정)
-        font_path = os.path.join(
-            os.path.dirname(__file__), "fonts", "NanumGothic.ttf"
-        )  # 예시 폰트 파일명
-
-        try:
-            # 폰트 파일 직접 로드
-            self.font_large = pygame.font.Font(font_path, 48)
-            self.font_medium = pygame.font.Font(font_path, 36)
-            self.font_small = pygame.font.Font(font_path, 24)
-        except pygame.error as e:
-            print(f"폰트 로드 오류: {e}")
-            # 폰트 로드에 실패한 경우, 시스템 기본 폰트 사용 (한글 지원 안될 수 있음)
-            try:
-                # macOS에서 주로 사용되는 한글 폰트들
-                available_fonts = [
-                    "AppleGothic",
-                    "AppleSDGothicNeo-Regular",
-                    "NanumGothic",
-                    "NanumBarunGothic",
-                    "Arial Unicode MS",
-                    "Arial",
-                ]
-
-                # 사용 가능한 폰트 찾기
-                self.font_name = None
-                for font_name_system in available_fonts:
-                    if (
-                        font_name_system in pygame.font.get_fonts()
-                        or os.path.exists(f"/Library/Fonts/{font_name_system}.ttf")
-                        or os.path.exists(
-                            f"/System/Library/Fonts/{font_name_system}.ttf"
-                        )
-                    ):
-                        self.font_name = font_name_system
-                        break
-
-                if not self.font_name:
-                    self.font_name = pygame.font.get_default_font()
-
-                self.font_large = pygame.font.SysFont(self.font_name, 48)
-                self.font_medium = pygame.font.SysFont(self.font_name, 36)
-                self.font_small = pygame.font.SysFont(self.font_name, 24)
-            except:
-                # 시스템 폰트도 실패하면 Pygame 기본 폰트 사용
-                self.font_large = pygame.font.Font(None, 48)
-                self.font_medium = pygame.font.Font(None, 36)
-                self.font_small = pygame.font.Font(None, 24)
+        # 렌더링된 텍스트 Surface 캐시 (정적인 라벨을 매 프레임 다시 그리지 않도록)
+        self.text_cache = TextCache()
+
+        # 폰트 파일은 한 번만 찾아 캐시해 두고, 크기별 폰트는 처음 사용할 때 로드
+        # (룰렛과 목록의 행 캐시가 이 폰트를 계속 쓰므로 실행 중에는 바꾸지 않음)
+        self.fonts = FontLibrary()
+        # 여러 줄 텍스트 배치 결과 캐시 (긴 질문 표시용)
+        self.text_layout = TextLayout(self.fonts, self.text_cache)
+
+    @property
+    def font_large(self):
+        return self.fonts.get(FONT_SIZE_LARGE)
+
+    @property
+    def font_medium(self):
+        return self.fonts.get(FONT_SIZE_MEDIUM)
+
+    @property
+    def font_small(self):
+        return self.fonts.get(FONT_SIZE_SMALL)
+
+    def render_text(self, text, font, color, antialias=True):
+        """텍스트 Surface 반환 (캐시 사용)"""
+        return self.text_cache.render(font, text, color, antialias)
 
     def draw_text(self, text, font, color, x, y, center=True):
-        text_surface = font.render(text, True, color)
+        text_surface = self.render_text(text, font, color)
         text_rect = text_surface.get_rect()
         if center:
             text_rect.center = (x, y)
@@ -65,8 +49,16 @@ class UI:
         self.screen.blit(text_surface, text_rect)
         return text_rect
 
+    def draw_text_box(self, text, size, color, rect, padding=10):
+        """rect 안에 여러 줄로 나눠 가운데 정렬해 그림 (넘치면 글자 크기를 줄임)"""
+        box = pygame.Rect(rect).inflate(-padding * 2, -padding * 2)
+        text_surface = self.text_layout.render(text, size, color, box.width, box.height)
+        text_rect = text_surface.get_rect(center=box.center)
+        self.screen.blit(text_surface, text_rect)
+        return text_rect
+
     def draw_button(self, text, font, text_color, button_color, x, y, padding=10):
-        text_surface = font.render(text, True, text_color)
+        text_surface = self.render_text(text, font, text_color)
         text_rect = text_surface.get_rect()
         text_rect.center = (x, y)
 
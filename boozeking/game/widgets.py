@@ -0,0 +1,96 @@
+import pygame
+
+HIT_CELL_SIZE = 64  # 클릭 판정용 격자 한 칸의 크기 (px)
+
+
+class Widget:
+    """화면에 그려진 클릭 가능한 영역 하나 (버튼, 입력 필드, 목록 행 등)"""
+
+    def __init__(self, rect, callback=None, args=(), kind="button"):
+        self.rect = pygame.Rect(rect)
+        self.callback = callback
+        self.args = args
+        self.kind = kind
+
+    def activate(self):
+        """클릭되었을 때 등록된 동작 실행 (동작의 반환값을 그대로 반환)"""
+        if self.callback is None:
+            return None
+        return self.callback(*self.args)
+
+
+class HitIndex:
+    """위젯을 격자 칸별로 모아 둔 클릭 판정 색인
+
+    위젯은 자신이 걸쳐 있는 칸마다 등록되므로, 클릭 위치가 속한 칸 하나만 확인하면
+    됩니다. 목록이 길어져도 한 칸에 들어가는 위젯 수는 화면 크기로 제한됩니다.
+    """
+
+    def __init__(self, cell_size=HIT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}  # (칸 x, 칸 y) -> 등록 순서대로 쌓인 위젯 목록
+        self.widgets = []
+
+    def __len__(self):
+        return len(self.widgets)
+
+    def add(self, widget):
+        """위젯 등록 (나중에 등록된 위젯이 위에 그려진 것으로 간주)"""
+        rect = widget.rect
+        if rect.width <= 0 or rect.height <= 0:
+            return widget
+        size = self.cell_size
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                self._cells.setdefault((cell_x, cell_y), []).append(widget)
+        self.widgets.append(widget)
+        return widget
+
+    def hit(self, pos):
+        """pos 위치에서 가장 위에 있는 위젯 (없으면 None)"""
+        x, y = pos
+        cell = self._cells.get((x // self.cell_size, y // self.cell_size))
+        if not cell:
+            return None
+        for widget in reversed(cell):
+            if widget.rect.collidepoint(x, y):
+                return widget
+        return None
+
+
+class WidgetRegistry:
+    """게임 상태별 위젯 색인
+
+    화면을 그릴 때 begin()으로 해당 상태의 색인을 새로 만들고 add()로 그린 위젯을
+    등록합니다. 클릭은 마지막으로 그린 색인에서 찾으므로 판정 영역이 화면과 항상
+    일치합니다.
+    """
+
+    def __init__(self, cell_size=HIT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._indexes = {}  # 상태 -> HitIndex
+        self._current = None
+
+    def begin(self, state):
+        """state 화면을 다시 그리기 시작 (이전에 등록된 위젯은 버림)"""
+        self._current = HitIndex(self.cell_size)
+        self._indexes[state] = self._current
+        return self._current
+
+    def add(self, rect, callback=None, *args, kind="button"):
+        """지금 그리는 화면에 위젯 등록 (callback(*args)가 클릭 시 실행됨)"""
+        if self._current is None:
+            return None
+        return self._current.add(Widget(rect, callback, args, kind))
+
+    def hit(self, state, pos):
+        """state 화면의 pos 위치에 있는 위젯 (없으면 None)"""
+        index = self._indexes.get(state)
+        if index is None:
+            return None
+        return index.hit(pos)
+
+    def clear(self):
+        """모든 상태의 색인 비우기"""
+        self._indexes = {}
+        self._current = None
@@ -1,4 +1,7 @@
+import argparse
+import math
 import os
+import random
 import sys
 import pygame
 from pygame.locals import *
@@ -6,10 +9,17 @@ import time
 import platform
 
 # 게임 모듈 임포트
-from game.ui import UI
+from game.ui import FONT_SIZE_LARGE, FONT_SIZE_MEDIUM, FONT_SIZE_SMALL, UI
 from game.question import QuestionManager
 from game.roulette import Roulette
 from game.manager import GameManager
+from game.clock import GameClock
+from game.engine import GameEngine, GameState
+from game.startup import BackgroundTask, StartupProfiler
+from game.roulette_model import SPIN_TIME_STEP
+from game.widgets import WidgetRegistry
+from game.listview import ListView
+from game.replay import ReplayLog, ReplayRecorder, ReplayReport
 
 # 색상 정의
 BLACK = (0, 0, 0)
@@ -20,210 +30,511 @@ BLUE = (0, 0, 255)
 GRAY = (200, 200, 200)
 DARK_GRAY = (100, 100, 100)
 
-
-# 게임 상태 정의
-class GameState:
-    MENU = 0
-    PLAYER_REGISTRATION = 1
-    QUESTION_SELECTION = 2
-    ROULETTE = 3
-    ANSWER = 4
-    RESULT = 5
+# 부분 갱신에 사용하는 화면 영역
+INPUT_RECT = pygame.Rect(250, 200, 300, 40)  # 플레이어 이름 입력 필드
+TIMER_RECT = pygame.Rect(0, 270, 800, 105)  # 남은 시간 텍스트와 타이머 바
+
+# 게임 타이머(답변 시간 초과 등)가 만료될 때 받는 이벤트
+TIMER_EVENT = pygame.USEREVENT + 1
+
+# 입력 기록에 남기는 이벤트 (게임 진행에 영향을 주는 것만)
+RECORDED_EVENTS = (
+    QUIT,
+    KEYDOWN,
+    MOUSEBUTTONDOWN,
+    MOUSEWHEEL,
+    VIDEOEXPOSE,
+    WINDOWEXPOSED,
+    TIMER_EVENT,
+)
+MENU_LIST_RECT = pygame.Rect(200, 395, 400, 150)  # 메뉴 화면의 플레이어 목록
+PLAYER_LIST_RECT = pygame.Rect(150, 345, 130, 210)  # 등록 화면의 플레이어 목록
+DELETE_BUTTON_RECT = pygame.Rect(100, 5, 20, 20)  # 등록 화면 목록 행 안의 삭제 버튼
+
+# 플레이어 목록 스크롤 키 -> (행 수, 페이지 수)
+LIST_SCROLL_KEYS = {
+    K_UP: (-1, 0),
+    K_DOWN: (1, 0),
+    K_PAGEUP: (0, -1),
+    K_PAGEDOWN: (0, 1),
+}
+
+
+# 상태별 목표 프레임 레이트 (애니메이션이 없는 화면은 낮은 주기로 이벤트만 대기)
+STATE_FPS = {
+    GameState.MENU: 5,
+    GameState.PLAYER_REGISTRATION: 5,
+    GameState.QUESTION_SELECTION: 5,
+    GameState.ROULETTE: 60,
+    GameState.ANSWER: 10,  # 남은 시간은 0.1초 단위로만 표시
+    GameState.RESULT: 5,
+}
+IDLE_FPS = 5  # 룰렛이 멈춘 뒤처럼 움직이는 것이 없을 때의 프레임 레이트
 
 
 class JimokwangGame:
-    def __init__(self):
-        # Pygame 초기화
-        pygame.init()
-        pygame.display.set_caption("Jimokwang - Drinking Game")
+    def __init__(self, profiler=None, seed=None, record_path=None, replay_log=None):
+        # 시작 단계별 소요 시간 기록 (BOOZEKING_PROFILE_STARTUP=1 이면 출력)
+        self.profiler = profiler or StartupProfiler.from_env()
+
+        # 룰렛과 질문 선택이 함께 쓰는 난수 생성기 (시드를 기록해 두면 재현 가능)
+        # replay_log가 있으면 기록된 시드와 플레이어 목록으로 시작하고 저장하지 않음
+        self.replay_log = replay_log
+        if replay_log is not None:
+            seed = replay_log.seed
+        elif seed is None:
+            seed = random.getrandbits(63)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # 입력 기록 파일 (게임을 시작할 때 연다)
+        self.record_path = record_path
+        self.recorder = None
+
+        # 필요한 Pygame 모듈만 초기화 (사운드 등 사용하지 않는 모듈은 초기화하지 않음)
+        with self.profiler.phase("pygame.init"):
+            pygame.display.init()
+            pygame.font.init()
 
         # 화면 설정
-        self.width, self.height = 800, 600
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        with self.profiler.phase("display"):
+            pygame.display.set_caption("Jimokwang - Drinking Game")
+            self.width, self.height = 800, 600
+            self.screen = pygame.display.set_mode((self.width, self.height))
         self.clock = pygame.time.Clock()
 
-        # 게임 상태 및 리소스 초기화
-        self.state = GameState.MENU
-        self.running = True
+        # 프레임 레이트 설정 (상태별로 조정 가능)
+        self.state_fps = dict(STATE_FPS)
+        self.idle_fps = IDLE_FPS
 
-        # 게임 매니저 초기화
-        data_path = os.path.join(os.path.dirname(__file__), "data", "players.json")
-        self.game_manager = GameManager(data_path)
+        # 룰렛과 답변 타이머가 공유하는 게임 시계
+        # GameClock(fixed_step=SPIN_TIME_STEP)으로 만들면 룰렛이 고정 시간 간격으로
+        # 진행되어 프레임 레이트와 관계없이 같은 결과를 재현함 (결정적인 리플레이용)
+        self.game_clock = GameClock()
 
-        # UI 초기화
-        self.ui = UI(self.screen)
+        self.running = True
 
-        # 질문 관리자 초기화
-        self.question_manager = QuestionManager()
+        # 화면 갱신 관련 변수 (변경된 영역만 다시 그리기)
+        self.dirty_rendering = True
+        self._full_redraw = True
+        self._dirty_rects = []
 
-        # 룰렛 초기화
-        self.roulette = Roulette(
-            self.screen, self.game_manager.players, self.ui.font_small
-        )
+        # 표시 중인 답변 남은 시간 (0.1초 단위, 바뀔 때만 다시 그림)
+        self._shown_tenths = None
+        self._timers_due = False
 
         # 입력 필드 관련 변수
         self.input_text = ""
         self.input_active = False
 
-        # 현재 선택된 질문과 플레이어
-        self.current_question = None
-        self.current_player = None
+        # 화면에 그려진 버튼/입력 필드/목록 행 (그릴 때 등록하고 클릭 판정에 사용)
+        self.widgets = WidgetRegistry()
+
+        # 첫 화면을 바로 띄우고 폰트, 플레이어, 질문은 백그라운드 스레드에서 로드
+        self.loaded = False
+        self._loader = BackgroundTask(self.load_assets, name="asset-loader")
+        self.render_loading()
+        self.profiler.mark("first_frame")
+
+    def load_assets(self):
+        """폰트, 플레이어 데이터, 질문 로드 (백그라운드 스레드에서 실행)"""
+        with self.profiler.phase("assets"):
+            # UI 초기화 (자주 쓰는 크기의 폰트를 미리 로드)
+            with self.profiler.phase("fonts"):
+                ui = UI(self.screen)
+                for size in (FONT_SIZE_LARGE, FONT_SIZE_MEDIUM, FONT_SIZE_SMALL):
+                    ui.fonts.get(size)
+
+            # 게임 매니저 초기화
+            with self.profiler.phase("players"):
+                if self.replay_log is not None:
+                    # 재생할 때는 기록 당시의 플레이어로 시작하고 파일에 저장하지 않음
+                    game_manager = GameManager(None, time_source=self.game_clock.now)
+                    game_manager.add_players(
+                        self.replay_log.players,
+                        dict(zip(self.replay_log.players, self.replay_log.weights)),
+                    )
+                else:
+                    data_path = os.path.join(
+                        os.path.dirname(__file__), "data", "players.json"
+                    )
+                    game_manager = GameManager(
+                        data_path, time_source=self.game_clock.now
+                    )
+
+            # 질문 관리자 초기화 (data/questions/*.txt 가 있으면 카테고리별로 추가)
+            with self.profiler.phase("questions"):
+                question_manager = QuestionManager(self.rng)
+                questions_dir = os.path.join(
+                    os.path.dirname(__file__), "data", "questions"
+                )
+                if os.path.isdir(questions_dir):
+                    question_manager.load_bank(questions_dir)
+                # 큰 질문 파일의 줄 색인도 여기서 만들어 첫 게임 시작 클릭이 멈추지 않게 함
+                question_manager.prepare()
+
+        return ui, game_manager, question_manager
+
+    def finish_loading(self):
+        """백그라운드 로드가 끝나길 기다린 뒤 룰렛과 게임 엔진 구성"""
+        if self.loaded:
+            return
+
+        with self.profiler.phase("wait_assets"):
+            self.ui, self.game_manager, self.question_manager = self._loader.result()
+
+        # 룰렛 초기화
+        with self.profiler.phase("roulette"):
+            self.roulette = Roulette(
+                self.screen,
+                self.game_manager.players,
+                self.ui.font_small,
+                text_cache=self.ui.text_cache,
+                weights=self.game_manager.get_weights(),
+                rng=self.rng,
+            )
+
+        # 플레이어 목록 (보이는 행만 그리고 마우스 휠/방향키로 스크롤)
+        self.menu_list = ListView(MENU_LIST_RECT, self.render_menu_row)
+        self.player_list = ListView(PLAYER_LIST_RECT, self.render_player_row)
+
+        # 게임 진행 로직 (pygame과 무관한 엔진, 이 클래스는 입력과 화면만 담당)
+        # engine.skip_spin_animation을 True로 하면 룰렛 애니메이션 없이 바로 결과 표시
+        # 타이머는 매 프레임 확인하지 않고 만료 시각에 TIMER_EVENT를 받아 실행
+        self.engine = GameEngine(
+            self.game_manager,
+            self.question_manager,
+            self.roulette,
+            self.game_clock,
+            poll_timers=False,
+        )
+        self.engine.timers.subscribe(self.on_timers_changed)
+        # 상태가 바뀌면 화면 전체를 다시 그림
+        self.engine.subscribe(self.on_state_changed)
+        # 플레이어 목록이 바뀌면 (일괄 작업은 한 번만) 화면 갱신
+        self.game_manager.players.subscribe(self.on_players_changed)
+
+        self.loaded = True
+        self.mark_dirty()
+        self.profiler.mark("ready")
+        self.profiler.report()
+
+    def render_loading(self):
+        """로딩 화면 (폰트를 쓰지 않고 도형만으로 진행 표시)"""
+        self.screen.fill(WHITE)
+        bar_rect = pygame.Rect(0, 0, 300, 12)
+        bar_rect.center = (self.width // 2, self.height // 2)
+        pygame.draw.rect(self.screen, GRAY, bar_rect, border_radius=6)
+
+        # 막대 안을 좌우로 오가는 블록
+        block_width = 80
+        travel = bar_rect.width - block_width
+        phase = (pygame.time.get_ticks() // 4) % (travel * 2)
+        offset = phase if phase < travel else travel * 2 - phase
+        block_rect = pygame.Rect(bar_rect.x + offset, bar_rect.y, block_width, 12)
+        pygame.draw.rect(self.screen, BLUE, block_rect, border_radius=6)
+        pygame.display.flip()
+
+    @property
+    def state(self):
+        """현재 게임 상태"""
+        return self.engine.state
+
+    @property
+    def current_question(self):
+        """현재 선택된 질문"""
+        return self.engine.current_question
+
+    @property
+    def current_player(self):
+        """현재 지목된 플레이어"""
+        return self.engine.current_player
+
+    def on_state_changed(self, previous, state):
+        """게임 상태 변경 알림 처리"""
+        self.mark_dirty()
+
+    def mark_dirty(self, rect=None):
+        """다시 그려야 할 영역 표시 (rect가 없으면 화면 전체)"""
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    def on_players_changed(self, kind, names):
+        """플레이어 목록 변경 알림 처리 (룰렛은 엔진이 갱신)"""
+        self.mark_dirty()
+
+    def on_timers_changed(self, delay):
+        """다음 타이머 만료 시각에 맞춰 TIMER_EVENT 예약 (None이면 예약 해제)"""
+        if self.replay_log is not None:
+            # 재생할 때는 기록된 TIMER_EVENT를 사용
+            return
+        if delay is None:
+            pygame.time.set_timer(TIMER_EVENT, 0)
+        else:
+            pygame.time.set_timer(TIMER_EVENT, max(1, math.ceil(delay * 1000)), 1)
+
+    def is_animating(self):
+        """매 프레임 갱신이 필요한 상태인지 확인 (룰렛 회전 중)"""
+        return self.state == GameState.ROULETTE and self.roulette.spinning
+
+    def answer_tenths(self):
+        """답변 화면에 표시할 남은 시간 (0.1초 단위로 올림한 정수)"""
+        return math.ceil(self.game_manager.get_remaining_time() * 10 - 1e-9)
+
+    def get_wait_timeout(self):
+        """정적인 화면에서 이벤트를 기다릴 최대 시간 (ms)"""
+        timeout = 1000 // max(1, self.get_target_fps())
+        if self.state == GameState.ANSWER:
+            # 표시하는 0.1초 자리가 바뀌는 시점까지만 대기
+            remaining = self.game_manager.get_remaining_time()
+            next_change = remaining - (self.answer_tenths() - 1) / 10
+            timeout = min(timeout, max(1, math.ceil(next_change * 1000)))
+        return timeout
+
+    def get_target_fps(self):
+        """현재 상태의 목표 프레임 레이트"""
+        if self.state == GameState.ROULETTE and not self.roulette.spinning:
+            return self.idle_fps
+        return self.state_fps.get(self.state, self.idle_fps)
+
+    def wait_events(self, timeout):
+        """이벤트가 올 때까지 최대 timeout(ms) 동안 대기 후 쌓인 이벤트 반환"""
+        event = pygame.event.wait(timeout)
+        if event.type == NOEVENT:
+            return []
+        return [event] + pygame.event.get()
 
     def run(self):
         """게임 메인 루프"""
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(60)
+        # 리소스 로드가 끝날 때까지 로딩 화면 표시
+        while self.running and not self._loader.done():
+            for event in self.wait_events(1000 // 60):
+                if event.type == QUIT:
+                    self.running = False
+            self.render_loading()
+        self.finish_loading()
+
+        if self.record_path:
+            self.start_recording(self.record_path)
+
+        try:
+            while self.running:
+                fps = self.get_target_fps()
+                if self.is_animating():
+                    events = pygame.event.get()
+                    self.step(events, self.game_clock.tick())
+                    self.clock.tick(fps)
+                else:
+                    # 정적인 화면에서는 이벤트가 들어오거나 다음 틱이 될 때까지 대기
+                    events = self.wait_events(self.get_wait_timeout())
+                    # 대기한 시간은 게임 시간에 포함하지 않음 (회전 시작 시 튀지 않도록)
+                    # 진행 중인 타이머가 있으면 기다린 시간도 흘러가야 하므로 그대로 둠
+                    if not self.engine.timers:
+                        self.game_clock.resume()
+                    self.step(events, self.game_clock.tick())
+                    self.clock.tick()
+        finally:
+            if self.recorder is not None:
+                self.recorder.close()
+            # 종료 전에 밀린 플레이어 데이터 저장 (루프가 예외로 끝나도 저장)
+            self.game_manager.close()
 
         pygame.quit()
         sys.exit()
 
-    def handle_events(self):
+    def step(self, events, dt):
+        """한 프레임 진행 (게임 시간은 이미 dt초 진행된 상태에서 입력 처리와 그리기)"""
+        if self.recorder is not None:
+            self.recorder.record(dt, events)
+        self.handle_events(events)
+        self.update(dt)
+        self.render()
+
+    def start_recording(self, path):
+        """지금부터의 입력과 프레임별 델타 타임을 path에 기록"""
+        self.recorder = ReplayRecorder(
+            path,
+            self.seed,
+            self.game_manager.players.as_list(),
+            self.game_manager.get_weights(),
+            RECORDED_EVENTS,
+        )
+
+    def run_replay(self):
+        """기록된 입력을 기다리지 않고 최대 속도로 재생한 뒤 결과 요약 반환"""
+        self.finish_loading()
+        frame_times = []
+        start = time.perf_counter()
+        for dt, events in self.replay_log.frames:
+            if not self.running:
+                break
+            frame_start = time.perf_counter()
+            self.step(events, self.game_clock.advance(dt))
+            frame_times.append(time.perf_counter() - frame_start)
+        elapsed = time.perf_counter() - start
+        self.game_manager.close()
+        return ReplayReport(
+            len(frame_times),
+            self.game_clock.now(),
+            elapsed,
+            frame_times,
+            self.state,
+            self.current_player,
+        )
+
+    def handle_events(self, events=None):
         """이벤트 처리"""
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+
+        for event in events:
             if event.type == QUIT:
                 self.running = False
 
+            elif event.type == TIMER_EVENT:
+                # 게임 시계를 진행한 뒤 update()에서 만료된 타이머 실행
+                self._timers_due = True
+
+            elif event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                # 창이 다시 보이게 되면 화면 전체 갱신
+                self.mark_dirty()
+
             elif event.type == KEYDOWN:
                 if event.key == K_ESCAPE:
                     if self.state == GameState.MENU:
                         self.running = False
                     else:
-                        self.state = GameState.MENU
+                        self.engine.dispatch("back")
+
+                # 플레이어 목록 스크롤
+                if event.key in LIST_SCROLL_KEYS:
+                    self.scroll_list(*LIST_SCROLL_KEYS[event.key])
 
                 # 입력 필드 활성화 상태에서 텍스트 입력 처리
-                if self.input_active:
+                elif self.input_active:
                     if event.key == K_RETURN:
-                        if self.state == GameState.PLAYER_REGISTRATION:
-                            if self.input_text:
-                                self.game_manager.add_player(self.input_text)
-                                self.input_text = ""
-                                # 룰렛 플레이어 목록 업데이트
-                                self.roulette = Roulette(
-                                    self.screen,
-                                    self.game_manager.players,
-                                    self.ui.font_small,
-                                )
+                        if self.input_text and self.engine.dispatch(
+                            "add_player", self.input_text
+                        ):
+                            self.input_text = ""
+                            self.mark_dirty(INPUT_RECT)
+                            # 방금 추가한 플레이어가 보이도록 목록 끝으로 스크롤
+                            count = len(self.game_manager.players)
+                            self.player_list.ensure_visible(count - 1, count)
                     elif event.key == K_BACKSPACE:
                         self.input_text = self.input_text[:-1]
+                        self.mark_dirty(INPUT_RECT)
                     else:
                         # 한글 입력을 위한 유니코드 처리
                         if event.unicode:
                             self.input_text += event.unicode
+                            self.mark_dirty(INPUT_RECT)
+
+            elif event.type == MOUSEWHEEL:
+                # 휠을 위로 굴리면 (y > 0) 목록 위쪽으로
+                self.scroll_list(-event.y)
 
             elif event.type == MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-
-                # 메뉴 화면에서의 버튼 클릭 처리
-                if self.state == GameState.MENU:
-                    # 시작 버튼 영역 (임시)
-                    start_btn_rect = pygame.Rect(300, 200, 200, 50)
-                    if start_btn_rect.collidepoint(mouse_pos):
-                        if len(self.game_manager.players) > 1:
-                            self.state = GameState.QUESTION_SELECTION
-                            self.current_question = (
-                                self.question_manager.get_random_question()
-                            )
-                        else:
-                            self.state = GameState.PLAYER_REGISTRATION
-
-                    # 플레이어 등록 버튼 영역 (임시)
-                    player_btn_rect = pygame.Rect(300, 270, 200, 50)
-                    if player_btn_rect.collidepoint(mouse_pos):
-                        self.state = GameState.PLAYER_REGISTRATION
-                        self.input_active = True
-
-                # 플레이어 등록 화면에서의 버튼 클릭 처리
-                elif self.state == GameState.PLAYER_REGISTRATION:
-                    # 입력 필드 클릭 처리
-                    input_rect = pygame.Rect(250, 200, 300, 40)
-                    self.input_active = input_rect.collidepoint(mouse_pos)
-
-                    # 돌아가기 버튼
-                    back_btn_rect = pygame.Rect(300, 400, 200, 50)
-                    if back_btn_rect.collidepoint(mouse_pos):
-                        self.state = GameState.MENU
-
-                    # 시작 버튼 (플레이어가 2명 이상일 때만 활성화)
-                    if len(self.game_manager.players) > 1:
-                        start_btn_rect = pygame.Rect(300, 330, 200, 50)
-                        if start_btn_rect.collidepoint(mouse_pos):
-                            self.state = GameState.QUESTION_SELECTION
-                            self.current_question = (
-                                self.question_manager.get_random_question()
-                            )
-
-                    # 플레이어 삭제 버튼 처리
-                    if self.game_manager.players:
-                        for i, player in enumerate(self.game_manager.players):
-                            y_pos = 360 + i * 30
-                            if y_pos < self.height - 50:
-                                # 삭제 버튼 영역
-                                delete_btn_rect = pygame.Rect(250, y_pos - 10, 20, 20)
-                                if delete_btn_rect.collidepoint(mouse_pos):
-                                    self.game_manager.remove_player(player)
-                                    # 룰렛 플레이어 목록 업데이트
-                                    self.roulette = Roulette(
-                                        self.screen,
-                                        self.game_manager.players,
-                                        self.ui.font_small,
-                                    )
-                                    break
-
-                # 질문 선택 화면에서의 버튼 클릭 처리
-                elif self.state == GameState.QUESTION_SELECTION:
-                    # 다음 버튼
-                    next_btn_rect = pygame.Rect(300, 400, 200, 50)
-                    if next_btn_rect.collidepoint(mouse_pos):
-                        self.state = GameState.ROULETTE
-                        self.roulette.start_spin()
-
-                # 룰렛 화면에서의 버튼 클릭 처리
-                elif self.state == GameState.ROULETTE:
-                    if not self.roulette.spinning and self.roulette.selected_player:
-                        # 다음 버튼
-                        next_btn_rect = pygame.Rect(300, 500, 200, 50)
-                        if next_btn_rect.collidepoint(mouse_pos):
-                            self.state = GameState.ANSWER
-                            self.current_player = self.roulette.selected_player
-                            self.game_manager.set_current_player(self.current_player)
-                            self.game_manager.set_current_question(
-                                self.current_question
-                            )
-                            self.game_manager.start_timer()
-
-                # 답변 화면에서의 버튼 클릭 처리
-                elif self.state == GameState.ANSWER:
-                    # 답변 완료 버튼
-                    answer_btn_rect = pygame.Rect(300, 400, 200, 50)
-                    if answer_btn_rect.collidepoint(mouse_pos):
-                        self.state = GameState.RESULT
-
-                # 결과 화면에서의 버튼 클릭 처리
-                elif self.state == GameState.RESULT:
-                    # 다음 라운드 버튼
-                    next_round_btn_rect = pygame.Rect(300, 400, 200, 50)
-                    if next_round_btn_rect.collidepoint(mouse_pos):
-                        self.state = GameState.QUESTION_SELECTION
-                        self.current_question = (
-                            self.question_manager.get_random_question()
-                        )
-
-    def update(self):
-        """게임 상태 업데이트"""
-        if self.state == GameState.ROULETTE:
-            self.roulette.update()
+                # 휠 스크롤도 버튼 4, 5로 들어오므로 클릭으로 처리하지 않음
+                if event.button not in (4, 5):
+                    self.handle_click(event.pos)
+
+    def handle_click(self, mouse_pos):
+        """클릭 위치의 위젯을 찾아 등록된 동작 실행"""
+        widget = self.widgets.hit(self.state, mouse_pos)
+
+        # 입력 필드 밖을 클릭하면 입력 비활성화
+        if self.input_active and (widget is None or widget.kind != "input"):
+            self.input_active = False
+            self.mark_dirty(INPUT_RECT)
+
+        if widget is not None:
+            widget.activate()
+
+    def current_list(self):
+        """현재 화면의 플레이어 목록 (목록이 없는 화면이면 None)"""
+        if self.state == GameState.MENU:
+            return self.menu_list
+        if self.state == GameState.PLAYER_REGISTRATION:
+            return self.player_list
+        return None
+
+    def scroll_list(self, rows=0, pages=0):
+        """현재 화면의 플레이어 목록을 rows행 + pages페이지만큼 스크롤"""
+        view = self.current_list()
+        if view is None:
+            return
+        rows += pages * view.page_rows()
+        if view.scroll_by(rows * view.row_height, len(self.game_manager.players)):
+            self.mark_dirty(view.rect)
+
+    def open_registration(self):
+        """플레이어 등록 화면으로 이동하고 바로 이름을 입력할 수 있게 함"""
+        if self.engine.dispatch("register"):
+            self.input_active = True
+
+    def focus_input(self):
+        """플레이어 이름 입력 필드 활성화"""
+        if not self.input_active:
+            self.input_active = True
+            self.mark_dirty(INPUT_RECT)
+
+    def skip_spin(self):
+        """회전 중인 룰렛의 애니메이션을 건너뛰고 결과 표시"""
+        self.engine.dispatch("skip")
+        self.mark_dirty()
+
+    def update(self, dt=SPIN_TIME_STEP):
+        """게임 상태 업데이트 (dt: 지난 프레임 이후 흐른 게임 시간, 초)"""
+        was_spinning = self.state == GameState.ROULETTE and self.roulette.spinning
+        self.engine.update(dt)
+        if self._timers_due:
+            # 이벤트가 조금 일찍 와서 아직 만료되지 않았으면 다시 예약됨
+            self._timers_due = False
+            self.engine.timers.run_due()
+
+        if was_spinning and self.state == GameState.ROULETTE:
+            if self.roulette.spinning:
+                # 회전 중에는 룰렛 영역만 다시 그림
+                self.mark_dirty(self.roulette.get_rect())
+            else:
+                # 멈추면 선택 결과와 버튼이 나타나므로 전체 갱신
+                self.mark_dirty()
 
         elif self.state == GameState.ANSWER:
-            # 타이머 체크
-            if self.game_manager.is_time_up():
-                self.state = GameState.RESULT
+            # 표시하는 남은 시간이 바뀐 경우에만 타이머 영역을 다시 그림
+            if self.answer_tenths() != self._shown_tenths:
+                self.mark_dirty(TIMER_RECT)
 
     def render(self):
-        """화면 렌더링"""
-        self.screen.fill(WHITE)
+        """화면 렌더링 (변경된 내용이 없으면 건너뜀)"""
+        if not self.dirty_rendering:
+            self.screen.fill(WHITE)
+            self.render_state()
+            pygame.display.flip()
+            return
+
+        if self._full_redraw:
+            self.screen.fill(WHITE)
+            self.render_state()
+            pygame.display.flip()
+        elif self._dirty_rects:
+            # 변경된 영역만 잘라서 다시 그린 뒤 해당 영역만 화면에 반영
+            clip_rect = self._dirty_rects[0].unionall(self._dirty_rects[1:])
+            self.screen.set_clip(clip_rect)
+            self.screen.fill(WHITE)
+            self.render_state()
+            self.screen.set_clip(None)
+            pygame.display.update(self._dirty_rects)
+
+        self._full_redraw = False
+        self._dirty_rects = []
+
+    def render_state(self):
+        """현재 상태의 화면 그리기 (그리면서 클릭할 수 있는 위젯도 다시 등록)"""
+        self.widgets.begin(self.state)
 
         # 메뉴 화면
         if self.state == GameState.MENU:
@@ -249,8 +560,6 @@ class JimokwangGame:
         elif self.state == GameState.RESULT:
             self.render_result()
 
-        pygame.display.flip()
-
     def render_menu(self):
         """메뉴 화면 렌더링"""
         # 타이틀
@@ -274,6 +583,7 @@ class JimokwangGame:
             225,
             20,
         )
+        self.widgets.add(start_btn_rect, self.engine.dispatch, "start")
         player_btn_rect = self.ui.draw_button(
             "플레이어 등록",
             self.ui.font_medium,
@@ -283,6 +593,7 @@ class JimokwangGame:
             295,
             20,
         )
+        self.widgets.add(player_btn_rect, self.open_registration)
 
         # 등록된 플레이어 표시
         self.ui.draw_text(
@@ -298,12 +609,17 @@ class JimokwangGame:
                 410,
             )
         else:
-            for i, player in enumerate(self.game_manager.players):
-                y_pos = 410 + i * 30
-                if y_pos < self.height - 50:  # 화면 범위 내에서만 표시
-                    self.ui.draw_text(
-                        player, self.ui.font_small, BLACK, self.width // 2, y_pos
-                    )
+            # 스크롤 위치에서 보이는 행만 그림
+            self.menu_list.draw(self.screen, self.game_manager.players)
+
+    def render_menu_row(self, player):
+        """메뉴 화면 플레이어 목록의 행 하나"""
+        row = pygame.Surface(
+            (MENU_LIST_RECT.width, self.menu_list.row_height), pygame.SRCALPHA
+        )
+        text_surface = self.ui.render_text(player, self.ui.font_small, BLACK)
+        row.blit(text_surface, text_surface.get_rect(center=row.get_rect().center))
+        return row
 
     def render_player_registration(self):
         """플레이어 등록 화면 렌더링"""
@@ -313,12 +629,13 @@ class JimokwangGame:
         )
 
         # 입력 필드
-        input_rect = pygame.Rect(250, 200, 300, 40)
+        input_rect = INPUT_RECT
         input_color = GREEN if self.input_active else GRAY
         pygame.draw.rect(self.screen, input_color, input_rect, 2)
+        self.widgets.add(input_rect, self.focus_input, kind="input")
 
         # 입력 텍스트
-        input_surface = self.ui.font_small.render(self.input_text, True, BLACK)
+        input_surface = self.ui.render_text(self.input_text, self.ui.font_small, BLACK)
         self.screen.blit(input_surface, (input_rect.x + 5, input_rect.y + 5))
 
         # 안내 텍스트
@@ -341,9 +658,11 @@ class JimokwangGame:
             330,
             20,
         )
+        self.widgets.add(start_btn_rect, self.engine.dispatch, "start")
         back_btn_rect = self.ui.draw_button(
             "돌아가기", self.ui.font_medium, BLACK, RED, self.width // 2, 400, 20
         )
+        self.widgets.add(back_btn_rect, self.engine.dispatch, "back")
 
         # 등록된 플레이어 표시
         self.ui.draw_text("등록된 플레이어", self.ui.font_small, BLACK, 150, 330)
@@ -351,23 +670,36 @@ class JimokwangGame:
         if not self.game_manager.players:
             self.ui.draw_text("없음", self.ui.font_small, DARK_GRAY, 150, 360)
         else:
-            for i, player in enumerate(self.game_manager.players):
-                y_pos = 360 + i * 30
-                if y_pos < self.height - 50:  # 화면 범위 내에서만 표시
-                    player_text = self.ui.draw_text(
-                        player, self.ui.font_small, BLACK, 150, y_pos, center=False
+            # 보이는 행만 그리고, 그 행의 삭제 버튼 (X)만 클릭할 수 있게 등록
+            visible = self.player_list.draw(self.screen, self.game_manager.players)
+            for index, player, row_rect in visible:
+                delete_btn_rect = DELETE_BUTTON_RECT.move(row_rect.topleft)
+                # 목록 가장자리에 걸친 행은 보이는 부분만 클릭 가능
+                delete_btn_rect = delete_btn_rect.clip(self.player_list.rect)
+                if delete_btn_rect:
+                    self.widgets.add(
+                        delete_btn_rect,
+                        self.engine.dispatch,
+                        "remove_player",
+                        player,
+                        kind="row",
                     )
 
-                    # 삭제 버튼 (X) 추가
-                    delete_btn_rect = pygame.Rect(250, y_pos - 10, 20, 20)
-                    pygame.draw.rect(self.screen, RED, delete_btn_rect)
-                    self.ui.draw_text(
-                        "X",
-                        self.ui.font_small,
-                        WHITE,
-                        delete_btn_rect.centerx,
-                        delete_btn_rect.centery,
-                    )
+    def render_player_row(self, player):
+        """등록 화면 플레이어 목록의 행 하나 (이름과 삭제 버튼)"""
+        row = pygame.Surface(
+            (PLAYER_LIST_RECT.width, self.player_list.row_height), pygame.SRCALPHA
+        )
+        text_surface = self.ui.render_text(player, self.ui.font_small, BLACK)
+        row.blit(
+            text_surface, text_surface.get_rect(midleft=(0, row.get_height() // 2))
+        )
+
+        # 삭제 버튼 (X)
+        pygame.draw.rect(row, RED, DELETE_BUTTON_RECT)
+        x_surface = self.ui.render_text("X", self.ui.font_small, WHITE)
+        row.blit(x_surface, x_surface.get_rect(center=DELETE_BUTTON_RECT.center))
+        return row
 
     def render_question_selection(self):
         """질문 선택 화면 렌더링"""
@@ -380,14 +712,15 @@ class JimokwangGame:
 
         # 질문 텍스트 (여러 줄로 표시)
         if self.current_question:
-            self.ui.draw_text(
-                self.current_question, self.ui.font_medium, BLACK, self.width // 2, 250
+            self.ui.draw_text_box(
+                self.current_question, FONT_SIZE_MEDIUM, BLACK, question_rect
             )
 
         # 다음 버튼
         next_btn_rect = self.ui.draw_button(
             "룰렛 돌리기", self.ui.font_medium, BLACK, GREEN, self.width // 2, 400, 20
         )
+        self.widgets.add(next_btn_rect, self.engine.dispatch, "spin")
 
     def render_roulette(self):
         """룰렛 화면 렌더링"""
@@ -399,6 +732,10 @@ class JimokwangGame:
         # 룰렛 그리기 (룰렛 자체의 Y 중심은 roulette.py에서 조정 예정)
         self.roulette.draw()
 
+        # 회전 중에는 화면 어디를 클릭해도 애니메이션을 건너뜀
+        if self.roulette.spinning:
+            self.widgets.add(self.screen.get_rect(), self.skip_spin, kind="area")
+
         # 선택된 플레이어 표시 (Y좌표를 룰렛 하단에 맞게 조정)
         if not self.roulette.spinning and self.roulette.selected_player:
             # 룰렛의 Y 중심과 반지름을 고려하여 Y 위치 계산 (roulette.py와 동기화 필요)
@@ -421,6 +758,7 @@ class JimokwangGame:
                 roulette_bottom_y + 90,  # "선택된 플레이어" 텍스트 아래
                 20,
             )
+            self.widgets.add(next_btn_rect, self.engine.dispatch, "confirm")
 
     def render_answer(self):
         """답변 화면 렌더링"""
@@ -436,15 +774,17 @@ class JimokwangGame:
         # 질문 표시
         question_rect = pygame.Rect(100, 180, 600, 80)
         pygame.draw.rect(self.screen, GRAY, question_rect, border_radius=10)
-        self.ui.draw_text(
-            self.current_question, self.ui.font_medium, BLACK, self.width // 2, 220
-        )
+        if self.current_question:
+            self.ui.draw_text_box(
+                self.current_question, FONT_SIZE_MEDIUM, BLACK, question_rect
+            )
 
-        # 타이머 표시
-        remaining = self.game_manager.get_remaining_time()
-        timer_color = GREEN if remaining > 3 else RED
+        # 타이머 표시 (0.1초 단위로 올림해서 표시)
+        tenths = self.answer_tenths()
+        self._shown_tenths = tenths
+        timer_color = GREEN if tenths > 30 else RED
         self.ui.draw_text(
-            f"남은 시간: {remaining:.1f}초",
+            f"남은 시간: {tenths / 10:.1f}초",
             self.ui.font_large,
             timer_color,
             self.width // 2,
@@ -455,7 +795,7 @@ class JimokwangGame:
         timer_rect = pygame.Rect(150, 350, 500, 20)
         pygame.draw.rect(self.screen, GRAY, timer_rect)
 
-        progress_width = int(500 * (remaining / 10))
+        progress_width = int(500 * tenths / (self.game_manager.timer_duration * 10))
         if progress_width > 0:
             progress_rect = pygame.Rect(150, 350, progress_width, 20)
             pygame.draw.rect(self.screen, timer_color, progress_rect)
@@ -464,13 +804,12 @@ class JimokwangGame:
         answer_btn_rect = self.ui.draw_button(
             "답변 완료", self.ui.font_medium, BLACK, BLUE, self.width // 2, 400, 20
         )
+        self.widgets.add(answer_btn_rect, self.engine.dispatch, "answer")
 
     def render_result(self):
         """결과 화면 렌더링"""
-        # 타이머가 끝났는지 확인
-        time_up = self.game_manager.is_time_up()
-
-        if time_up:
+        # 답변/시간 초과로 넘어올 때 확정된 결과 사용 (시계를 다시 보지 않음)
+        if not self.engine.answered:
             # 시간 초과 메시지
             self.ui.draw_text(
                 "시간 초과!", self.ui.font_large, RED, self.width // 2, 100
@@ -498,16 +837,57 @@ class JimokwangGame:
         # 질문 표시
         question_rect = pygame.Rect(100, 230, 600, 80)
         pygame.draw.rect(self.screen, GRAY, question_rect, border_radius=10)
-        self.ui.draw_text(
-            self.current_question, self.ui.font_medium, BLACK, self.width // 2, 270
-        )
+        if self.current_question:
+            self.ui.draw_text_box(
+                self.current_question, FONT_SIZE_MEDIUM, BLACK, question_rect
+            )
 
         # 다음 라운드 버튼
         next_round_btn_rect = self.ui.draw_button(
             "다음 라운드", self.ui.font_medium, BLACK, GREEN, self.width // 2, 400, 20
         )
+        self.widgets.add(next_round_btn_rect, self.engine.dispatch, "next_round")
 
 
 if __name__ == "__main__":
-    game = JimokwangGame()
+    parser = argparse.ArgumentParser(description="Jimokwang - Drinking Game")
+    parser.add_argument(
+        "--import",
+        dest="import_path",
+        metavar="PATH",
+        help="플레이어 명단 파일 (CSV 또는 JSON Lines)을 가져와 등록",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="시작 단계별 소요 시간 출력 (BOOZEKING_PROFILE_STARTUP=1 과 같음)",
+    )
+    parser.add_argument(
+        "--record", metavar="PATH", help="입력과 프레임 시간을 PATH에 기록 (재생용)"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="기록한 입력을 화면 없이 최대 속도로 재생하고 결과 출력",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    args = parser.parse_args()
+
+    profiler = StartupProfiler.from_env()
+    if args.profile_startup:
+        profiler.enabled = True
+
+    if args.replay:
+        # 창을 띄우지 않고 재생 (이미 지정된 비디오 드라이버가 있으면 그대로 사용)
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        game = JimokwangGame(profiler, replay_log=ReplayLog.load(args.replay))
+        print(game.run_replay().format())
+        pygame.quit()
+        sys.exit()
+
+    game = JimokwangGame(profiler, seed=args.seed, record_path=args.record)
+    if args.import_path:
+        game.finish_loading()
+        count = game.game_manager.import_players(args.import_path)
+        print(f"플레이어 {count}명을 가져왔습니다")
     game.run()